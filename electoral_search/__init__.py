@@ -3,64 +3,75 @@ Electoral Roll OCR Search Package
 
 A production-ready tool for searching scanned Bengali electoral roll PDFs
 using OCR and fuzzy matching.
+
+Re-exports are resolved lazily (PEP 562) so importing the package does
+not drag in the whole dependency stack: worker processes that only need
+``process_pdf`` never import typer/rich, and the CLI never pays for
+modules it does not touch. ``from electoral_search import X`` still
+works for every name in ``__all__``.
 """
 
-from .cache import ResultCache
-from .cli import app, main
-from .config import (
-    DPI,
-    FUZZY_THRESHOLD_DEFAULT,
-    MAX_NAMES_FILE_SIZE_MB,
-    MAX_PDF_PAGES,
-    MAX_PDF_SIZE_MB,
-    MAX_SEARCH_NAMES,
-    OCR_CONFIG,
-    OCR_LANG,
-    ProcessingStats,
-    setup_logging,
-)
-from .export import export_results, export_to_csv, export_to_json
-from .ocr import process_pdf
-from .parallel import get_optimal_workers, process_pdfs_parallel
-from .text_processing import extract_voter_blocks, fuzzy_match, normalize_bn
-from .types import SearchResult, VoterInfo
-from .validation import validate_path_security, validate_pdf_file
+import importlib
+from typing import Any
 
 __version__ = "2.1.0"
-__all__ = [
+
+# Public name -> defining submodule, resolved on first attribute access
+_LAZY_IMPORTS = {
     # Config
-    "DPI",
-    "OCR_LANG",
-    "OCR_CONFIG",
-    "FUZZY_THRESHOLD_DEFAULT",
-    "MAX_PDF_SIZE_MB",
-    "MAX_PDF_PAGES",
-    "MAX_NAMES_FILE_SIZE_MB",
-    "MAX_SEARCH_NAMES",
-    "ProcessingStats",
-    "setup_logging",
+    "DPI": "config",
+    "OCR_LANG": "config",
+    "OCR_CONFIG": "config",
+    "FUZZY_THRESHOLD_DEFAULT": "config",
+    "MAX_PDF_SIZE_MB": "config",
+    "MAX_PDF_PAGES": "config",
+    "MAX_NAMES_FILE_SIZE_MB": "config",
+    "MAX_SEARCH_NAMES": "config",
+    "ProcessingStats": "config",
+    "setup_logging": "config",
     # Types
-    "VoterInfo",
-    "SearchResult",
+    "VoterInfo": "types",
+    "SearchResult": "types",
     # Validation
-    "validate_path_security",
-    "validate_pdf_file",
+    "validate_path_security": "validation",
+    "validate_pdf_file": "validation",
     # Text Processing
-    "normalize_bn",
-    "extract_voter_blocks",
-    "fuzzy_match",
+    "normalize_bn": "text_processing",
+    "extract_voter_blocks": "text_processing",
+    "fuzzy_match": "text_processing",
     # OCR
-    "process_pdf",
+    "process_pdf": "ocr",
     # Parallel Processing
-    "process_pdfs_parallel",
-    "get_optimal_workers",
+    "process_pdfs_parallel": "parallel",
+    "get_optimal_workers": "parallel",
     # Cache
-    "ResultCache",
+    "ResultCache": "cache",
     # Export
-    "export_to_json",
-    "export_to_csv",
-    "export_results",
+    "export_to_json": "export",
+    "export_to_csv": "export",
+    "export_results": "export",
     # CLI
-    "app",
-    "main",
-]
+    "app": "cli",
+    "main": "cli",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a public name from its submodule on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    # Cache on the package so subsequent accesses skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include lazy re-exports in dir(electoral_search)."""
+    return sorted(set(globals()) | set(__all__))
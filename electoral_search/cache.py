@@ -7,17 +7,188 @@ Caches OCR results based on PDF file hash to avoid reprocessing.
 import hashlib
 import json
 import logging
+import mmap
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from .types import SearchResult
+from .config import DPI, OCR_LANG
+from .types import SearchResult, VoterInfo
+
+try:
+    import blake3  # type: ignore
+
+    _HAS_BLAKE3 = True
+except ImportError:
+    _HAS_BLAKE3 = False
+
+try:
+    import orjson  # type: ignore
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import zstandard  # type: ignore
+
+    _HAS_ZSTD = True
+except ImportError:
+    _HAS_ZSTD = False
 
 logger = logging.getLogger(__name__)
 
 # Default cache directory
 CACHE_DIR = Path.home() / ".electoral_search_cache"
-CACHE_VERSION = "1.0"
+CACHE_VERSION = "2.0"
+INDEX_FILE = "index.json"
+
+# Bound on the in-memory (path, size, mtime) -> hash memo
+HASH_MEMO_MAX = 1024
+
+# Bound on the in-process LRU of recently served results
+RESULT_LRU_MAX = 128
+
+# zstd level 3 is the sweet spot for JSON-ish payloads: ~5-8x smaller
+# with negligible compression CPU next to OCR cost
+ZSTD_LEVEL = 3
+
+# Read size for file hashing; 1 MiB keeps syscall count low while letting
+# the hash implementation run at full throughput
+HASH_CHUNK_SIZE = 1 << 20
+
+# Files at or above this size are hashed as a tree of 8 MiB chunks across
+# a thread pool (hashlib releases the GIL on large buffers)
+TREE_HASH_MIN_SIZE = 64 << 20
+TREE_HASH_CHUNK_SIZE = 8 << 20
+
+# Weak fingerprint mode samples this much from each end of the file
+FINGERPRINT_SAMPLE_SIZE = 64 << 10
+
+
+def _new_file_hasher():
+    """Return the fastest available hasher for file fingerprinting.
+
+    Uses BLAKE3 (SIMD, multi-threaded) when installed; falls back to
+    SHA256 so cache keys remain reproducible without the optional dep.
+    """
+    if _HAS_BLAKE3:
+        return blake3.blake3()
+    return hashlib.sha256()
+
+
+def _dumps_cache(data: dict) -> bytes:
+    """Serialize cache data to bytes (orjson if available, else stdlib json)."""
+    if _HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads_cache(raw: bytes) -> dict:
+    """Deserialize cache bytes (orjson if available, else stdlib json)."""
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_cache_file(path: Path) -> dict:
+    """
+    Parse a cache file through a read-only memory map.
+
+    With orjson installed the mapped bytes are parsed in place with no
+    intermediate read buffer; the stdlib fallback still needs one copy
+    (json.loads does not accept arbitrary buffers) but skips the
+    BufferedReader layer.
+
+    Args:
+        path: Path to cache file
+
+    Returns:
+        Parsed cache data
+    """
+    if path.name.endswith(".zst"):
+        if not _HAS_ZSTD:
+            raise ValueError(f"zstandard not installed, cannot read {path.name}")
+        raw = zstandard.ZstdDecompressor().decompress(path.read_bytes())
+        return _loads_cache(raw)
+
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _HAS_ORJSON:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+            return json.loads(mm[:])
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """
+    Publish a file atomically via a same-directory temp file and rename.
+
+    Readers never observe a partially written file; a crash mid-write
+    leaves only a stale ``.tmp`` to be garbage-collected, not a corrupt
+    entry. No fsync: cache entries don't need crash durability, only
+    all-or-nothing visibility.
+
+    Args:
+        path: Final destination path
+        payload: File contents
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _hash_file_chunk(fd: int, offset: int, length: int) -> bytes:
+    """Hash one chunk of an open file using positional reads (thread-safe)."""
+    chunk_hash = _new_file_hasher()
+    remaining = length
+    while remaining > 0:
+        data = os.pread(fd, min(remaining, HASH_CHUNK_SIZE), offset)
+        if not data:
+            break
+        chunk_hash.update(data)
+        offset += len(data)
+        remaining -= len(data)
+    return chunk_hash.digest()
+
+
+def _tree_hash_file(file_path: Path, size: int) -> str:
+    """
+    Hash a large file as a Merkle-style tree of fixed-size chunks.
+
+    Chunk digests are computed in parallel threads and folded into an
+    outer hash in offset order, so the result is deterministic.
+
+    Args:
+        file_path: Path to file
+        size: File size in bytes
+
+    Returns:
+        Hex digest of the tree hash
+    """
+    offsets = range(0, size, TREE_HASH_CHUNK_SIZE)
+    workers = min(4, os.cpu_count() or 1, len(offsets))
+
+    outer_hash = _new_file_hasher()
+    with open(file_path, "rb") as f:
+        hash_chunk = partial(_hash_file_chunk, f.fileno())
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for digest in executor.map(lambda off: hash_chunk(off, TREE_HASH_CHUNK_SIZE), offsets):
+                outer_hash.update(digest)
+
+    return outer_hash.hexdigest()
 
 
 class ResultCache:
@@ -27,25 +198,133 @@ class ResultCache:
     Caches results by PDF file hash to avoid reprocessing identical files.
     """
 
-    def __init__(self, cache_dir: Optional[Path] = None, ttl_days: int = 30):
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_days: int = 30,
+        strict_hash: bool = False,
+    ):
         """
         Initialize the result cache.
 
         Args:
             cache_dir: Directory to store cache files (default: ~/.electoral_search_cache)
             ttl_days: Time to live for cache entries in days (default: 30)
+            strict_hash: Hash full file contents for cache keys instead of
+                the default head+tail+size fingerprint. A fingerprint
+                collision only means serving stale OCR results, not a
+                security issue, so the weak mode is the default.
         """
         self.cache_dir = cache_dir or CACHE_DIR
         self.ttl_days = ttl_days
         self.ttl = timedelta(days=ttl_days)
+        # Integer TTL for raw st_mtime_ns comparisons on the hot path
+        self.ttl_ns = ttl_days * 86400 * 10**9
+        self.strict_hash = strict_hash
+        self._hash_mode = "full" if strict_hash else "sample"
+
+        # Path-keyed fast-path: path -> (size, mtime_ns, mode, hash), so
+        # unchanged files skip hashing entirely. Persisted to index.json.
+        self._hash_memo: Dict[str, Tuple[int, int, str, str]] = {}
+        self._index_dirty = False
+
+        # Write-through LRU of recent results; disk stays ground truth
+        self._mem: OrderedDict[str, List[SearchResult]] = OrderedDict()
 
         # Create cache directory if it doesn't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Cache directory: {self.cache_dir}")
 
+        self._index_path = self.cache_dir / INDEX_FILE
+        self._load_hash_index()
+
+    def _load_hash_index(self) -> None:
+        """Load the persistent (path, size, mtime) -> hash index if present."""
+        try:
+            raw = _loads_cache(self._index_path.read_bytes())
+            self._hash_memo = {
+                path: (entry[0], entry[1], entry[2], entry[3])
+                for path, entry in raw.items()
+                if len(entry) == 4
+            }
+            logger.debug(f"Loaded hash index with {len(self._hash_memo)} entries")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable hash index: {e}")
+            self._hash_memo = {}
+
+    def _save_hash_index(self) -> None:
+        """Persist the hash index if it changed since the last save."""
+        if not self._index_dirty:
+            return
+
+        try:
+            data = {path: list(entry) for path, entry in self._hash_memo.items()}
+            _write_atomic(self._index_path, _dumps_cache(data))
+            self._index_dirty = False
+        except Exception as e:
+            logger.error(f"Error writing hash index: {e}")
+
     def _compute_file_hash(self, file_path: Path) -> str:
         """
-        Compute SHA256 hash of a file.
+        Compute content hash of a file (BLAKE3 if available, else SHA256).
+
+        Results are memoized by (path, size, mtime_ns) so unchanged files
+        are only hashed once per process.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Hex digest of file hash
+        """
+        st = file_path.stat()
+        path_key = str(file_path)
+
+        entry = self._hash_memo.get(path_key)
+        if (
+            entry is not None
+            and entry[0] == st.st_size
+            and entry[1] == st.st_mtime_ns
+            and entry[2] == self._hash_mode
+        ):
+            return entry[3]
+
+        if not self.strict_hash and st.st_size > 2 * FINGERPRINT_SAMPLE_SIZE:
+            digest = self._compute_file_fingerprint(file_path, st.st_size)
+        elif st.st_size >= TREE_HASH_MIN_SIZE:
+            # Large files: parallel tree hash across chunks
+            digest = _tree_hash_file(file_path, st.st_size)
+        else:
+            file_hash = _new_file_hasher()
+
+            # Reuse one buffer via readinto to avoid an allocation per chunk
+            buf = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+
+            with open(file_path, "rb") as f:
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    file_hash.update(view[:n])
+
+            digest = file_hash.hexdigest()
+
+        if len(self._hash_memo) >= HASH_MEMO_MAX:
+            self._hash_memo.clear()
+        self._hash_memo[path_key] = (st.st_size, st.st_mtime_ns, self._hash_mode, digest)
+        self._index_dirty = True
+
+        return digest
+
+    def compute_file_hash(self, file_path: Path) -> str:
+        """
+        Public wrapper around the memoized file hash.
+
+        Lets callers compute the hash once and hand it back to get/set,
+        instead of each call re-deriving it.
 
         Args:
             file_path: Path to file
@@ -53,16 +332,59 @@ class ResultCache:
         Returns:
             Hex digest of file hash
         """
-        sha256_hash = hashlib.sha256()
+        return self._compute_file_hash(file_path)
+
+    def _compute_file_fingerprint(self, file_path: Path, size: int) -> str:
+        """
+        Compute a weak content fingerprint: first and last 64 KiB plus size.
+
+        Reads 128 KiB regardless of file size — sufficient identity for an
+        OCR cache, where a collision costs a re-OCR rather than anything
+        security-relevant.
+
+        Args:
+            file_path: Path to file
+            size: File size in bytes
+
+        Returns:
+            Hex digest of the fingerprint
+        """
+        fingerprint = _new_file_hasher()
 
         with open(file_path, "rb") as f:
-            # Read in chunks to handle large files
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+            fingerprint.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+            f.seek(-FINGERPRINT_SAMPLE_SIZE, os.SEEK_END)
+            fingerprint.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+
+        fingerprint.update(str(size).encode())
+        return fingerprint.hexdigest()
+
+    @staticmethod
+    def compute_names_hash(search_names: List[str]) -> str:
+        """
+        Hash the search-name list for cache keying.
+
+        Callers processing many PDFs should compute this once and pass it
+        to get/set instead of paying the sort+join+hash per PDF.
 
-        return sha256_hash.hexdigest()
+        Args:
+            search_names: List of search names
+
+        Returns:
+            Short hex digest of the sorted name list
+        """
+        hasher = _new_file_hasher()
+        hasher.update("|".join(sorted(search_names)).encode())
+        return hasher.hexdigest()[:16]
 
-    def _get_cache_key(self, pdf_path: Path, search_names: List[str], threshold: int) -> str:
+    def _get_cache_key(
+        self,
+        pdf_path: Path,
+        search_names: List[str],
+        threshold: int,
+        names_hash: Optional[str] = None,
+        file_hash: Optional[str] = None,
+    ) -> str:
         """
         Generate cache key based on PDF hash and search parameters.
 
@@ -70,12 +392,16 @@ class ResultCache:
             pdf_path: Path to PDF file
             search_names: List of search names
             threshold: Fuzzy match threshold
+            names_hash: Precomputed compute_names_hash value, if available
+            file_hash: Precomputed compute_file_hash value, if available
 
         Returns:
             Cache key string
         """
-        file_hash = self._compute_file_hash(pdf_path)
-        names_hash = hashlib.sha256("|".join(sorted(search_names)).encode()).hexdigest()[:16]
+        if file_hash is None:
+            file_hash = self._compute_file_hash(pdf_path)
+        if names_hash is None:
+            names_hash = self.compute_names_hash(search_names)
 
         return f"{file_hash}_{names_hash}_{threshold}"
 
@@ -83,16 +409,69 @@ class ResultCache:
         """
         Get path to cache file for a given key.
 
+        Entries are sharded into 256 subdirectories on the first hex
+        byte of the key so no single directory grows into the tens of
+        thousands of files where scans degrade. They are
+        zstd-compressed (.json.zst) when the optional zstandard package
+        is installed, plain .json otherwise.
+
         Args:
             cache_key: Cache key
 
         Returns:
             Path to cache file
         """
-        return self.cache_dir / f"{cache_key}.json"
+        suffix = ".json.zst" if _HAS_ZSTD else ".json"
+        return self.cache_dir / cache_key[:2] / f"{cache_key}{suffix}"
+
+    def _find_entry(self, cache_key: str) -> Optional[Tuple[Path, os.stat_result]]:
+        """
+        Locate the on-disk file for a cache key, if any.
+
+        With zstandard installed, plain entries written without it stay
+        usable: the preferred suffix is tried first, then the alternate.
+        Without it, ``.zst`` entries are unreadable, so they are treated
+        as a miss and left on disk for when the package returns — the
+        generic error handling in the getters would otherwise mistake
+        them for corruption and delete them.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            (path, stat result) for the entry, or None if absent
+        """
+        cache_path = self._get_cache_path(cache_key)
+        try:
+            return cache_path, cache_path.stat()
+        except FileNotFoundError:
+            if not _HAS_ZSTD:
+                return None
+            alt = cache_path.parent / f"{cache_key}.json"
+            try:
+                return alt, alt.stat()
+            except (FileNotFoundError, OSError):
+                return None
+
+    def _entry_dirs(self) -> List[Path]:
+        """List directories that may hold cache entries (root + shards)."""
+        dirs = [self.cache_dir]
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                dirs.extend(
+                    Path(entry.path) for entry in entries if len(entry.name) == 2 and entry.is_dir()
+                )
+        except OSError as e:
+            logger.error(f"Error listing cache shards: {e}")
+        return dirs
 
     def get(
-        self, pdf_path: Path, search_names: List[str], threshold: int
+        self,
+        pdf_path: Path,
+        search_names: List[str],
+        threshold: int,
+        names_hash: Optional[str] = None,
+        file_hash: Optional[str] = None,
     ) -> Optional[List[SearchResult]]:
         """
         Retrieve cached results if available and not expired.
@@ -101,28 +480,36 @@ class ResultCache:
             pdf_path: Path to PDF file
             search_names: List of search names
             threshold: Fuzzy match threshold
+            names_hash: Precomputed compute_names_hash value, if available
+            file_hash: Precomputed compute_file_hash value, if available
 
         Returns:
             Cached results or None if not found/expired
         """
-        cache_key = self._get_cache_key(pdf_path, search_names, threshold)
-        cache_path = self._get_cache_path(cache_key)
+        cache_key = self._get_cache_key(pdf_path, search_names, threshold, names_hash, file_hash)
+
+        # Recently served or stored keys skip disk entirely
+        mem_hit = self._mem.get(cache_key)
+        if mem_hit is not None:
+            self._mem.move_to_end(cache_key)
+            logger.debug(f"Cache hit (memory): {pdf_path.name}")
+            return mem_hit
 
-        if not cache_path.exists():
+        entry = self._find_entry(cache_key)
+        if entry is None:
             logger.debug(f"Cache miss: {pdf_path.name}")
             return None
+        cache_path, st = entry
 
         try:
-            # Check if cache is expired
-            cache_mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
-            if datetime.now() - cache_mtime > self.ttl:
+            # Check if cache is expired (raw integer nanosecond comparison)
+            if time.time_ns() - st.st_mtime_ns > self.ttl_ns:
                 logger.info(f"Cache expired for {pdf_path.name}, removing")
                 cache_path.unlink()
                 return None
 
             # Load cached results
-            with open(cache_path, encoding="utf-8") as f:
-                cache_data = json.load(f)
+            cache_data = _load_cache_file(cache_path)
 
             # Verify cache version
             if cache_data.get("version") != CACHE_VERSION:
@@ -133,6 +520,7 @@ class ResultCache:
             results = cache_data.get("results", [])
             logger.info(f"Cache hit: {pdf_path.name} ({len(results)} results)")
 
+            self._remember(cache_key, results)
             return results
 
         except Exception as e:
@@ -151,6 +539,8 @@ class ResultCache:
         search_names: List[str],
         threshold: int,
         results: List[SearchResult],
+        names_hash: Optional[str] = None,
+        file_hash: Optional[str] = None,
     ) -> None:
         """
         Store results in cache.
@@ -160,8 +550,10 @@ class ResultCache:
             search_names: List of search names
             threshold: Fuzzy match threshold
             results: Search results to cache
+            names_hash: Precomputed compute_names_hash value, if available
+            file_hash: Precomputed compute_file_hash value, if available
         """
-        cache_key = self._get_cache_key(pdf_path, search_names, threshold)
+        cache_key = self._get_cache_key(pdf_path, search_names, threshold, names_hash, file_hash)
         cache_path = self._get_cache_path(cache_key)
 
         try:
@@ -175,14 +567,131 @@ class ResultCache:
                 "results": results,
             }
 
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            payload = _dumps_cache(cache_data)
+            if _HAS_ZSTD:
+                payload = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+            cache_path.parent.mkdir(exist_ok=True)
+            _write_atomic(cache_path, payload)
+            self._remember(cache_key, results)
+
+            # Piggyback index persistence on writes we already have to make
+            self._save_hash_index()
 
             logger.info(f"Cached {len(results)} results for {pdf_path.name}")
 
         except Exception as e:
             logger.error(f"Error writing cache for {pdf_path.name}: {e}")
 
+    def _voters_key(self, pdf_path: Path, file_hash: Optional[str] = None) -> str:
+        """
+        Cache key for the per-file extracted voters.
+
+        Keyed on content hash plus the OCR settings (DPI, language) and
+        deliberately not on the search names or threshold: the OCR output
+        is the same whatever is being searched for.
+
+        Args:
+            pdf_path: Path to PDF file
+            file_hash: Precomputed compute_file_hash value, if available
+
+        Returns:
+            Cache key string
+        """
+        if file_hash is None:
+            file_hash = self._compute_file_hash(pdf_path)
+        return f"{file_hash}_voters_{DPI}_{OCR_LANG}"
+
+    def get_voters(
+        self, pdf_path: Path, file_hash: Optional[str] = None
+    ) -> Optional[List[Tuple[int, List[VoterInfo]]]]:
+        """
+        Retrieve cached extracted voters for a PDF, if present and fresh.
+
+        A hit means OCR — the dominant cost — can be skipped entirely and
+        only the fuzzy-matching phase re-run, so changing the name list
+        between runs no longer re-reads the PDFs.
+
+        Args:
+            pdf_path: Path to PDF file
+            file_hash: Precomputed compute_file_hash value, if available
+
+        Returns:
+            List of (page number, voters) pairs, or None if not cached
+        """
+        cache_key = self._voters_key(pdf_path, file_hash)
+        entry = self._find_entry(cache_key)
+        if entry is None:
+            return None
+        cache_path, st = entry
+
+        try:
+            if time.time_ns() - st.st_mtime_ns > self.ttl_ns:
+                logger.info(f"Voter cache expired for {pdf_path.name}, removing")
+                cache_path.unlink()
+                return None
+
+            cache_data = _load_cache_file(cache_path)
+            if cache_data.get("version") != CACHE_VERSION:
+                logger.warning(f"Voter cache version mismatch for {pdf_path.name}")
+                cache_path.unlink()
+                return None
+
+            return [(page_no, voters) for page_no, voters in cache_data["pages"]]
+
+        except Exception as e:
+            logger.error(f"Error reading voter cache for {pdf_path.name}: {e}")
+            try:
+                cache_path.unlink()
+            except Exception:
+                logger.error(f"Failed to remove corrupted cache file: {cache_path}")
+            return None
+
+    def set_voters(
+        self,
+        pdf_path: Path,
+        pages: List[Tuple[int, List[VoterInfo]]],
+        file_hash: Optional[str] = None,
+    ) -> None:
+        """
+        Store extracted voters for a PDF.
+
+        Args:
+            pdf_path: Path to PDF file
+            pages: (page number, voters) pairs from extraction
+            file_hash: Precomputed compute_file_hash value, if available
+        """
+        cache_key = self._voters_key(pdf_path, file_hash)
+        cache_path = self._get_cache_path(cache_key)
+
+        try:
+            cache_data = {
+                "version": CACHE_VERSION,
+                "timestamp": datetime.now().isoformat(),
+                "pdf_name": pdf_path.name,
+                "dpi": DPI,
+                "lang": OCR_LANG,
+                "pages": [[page_no, voters] for page_no, voters in pages],
+            }
+
+            payload = _dumps_cache(cache_data)
+            if _HAS_ZSTD:
+                payload = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+            cache_path.parent.mkdir(exist_ok=True)
+            _write_atomic(cache_path, payload)
+            self._save_hash_index()
+
+            logger.info(f"Cached voters for {pdf_path.name} ({len(pages)} pages)")
+
+        except Exception as e:
+            logger.error(f"Error writing voter cache for {pdf_path.name}: {e}")
+
+    def _remember(self, cache_key: str, results: List[SearchResult]) -> None:
+        """Record results in the in-process LRU, evicting the oldest entry."""
+        self._mem[cache_key] = results
+        self._mem.move_to_end(cache_key)
+        while len(self._mem) > RESULT_LRU_MAX:
+            self._mem.popitem(last=False)
+
     def clear(self) -> int:
         """
         Clear all cache files.
@@ -191,10 +700,15 @@ class ResultCache:
             Number of cache files removed
         """
         count = 0
+        self._mem.clear()
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
-                count += 1
+            for entry_dir in self._entry_dirs():
+                for cache_file in entry_dir.glob("*.json*"):
+                    # The hash index is bookkeeping, not an entry
+                    if cache_file.name == INDEX_FILE:
+                        continue
+                    cache_file.unlink()
+                    count += 1
 
             logger.info(f"Cleared {count} cache files")
             return count
@@ -210,22 +724,38 @@ class ResultCache:
         Returns:
             Number of expired entries removed
         """
-        count = 0
         try:
-            now = datetime.now()
+            now_ns = time.time_ns()
+            entry_dirs = self._entry_dirs()
+            workers = min(8, len(entry_dirs))
 
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_mtime = datetime.fromtimestamp(cache_file.stat().st_mtime)
-                if now - cache_mtime > self.ttl:
-                    cache_file.unlink()
-                    count += 1
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                count = sum(
+                    executor.map(partial(self._clear_expired_dir, now_ns=now_ns), entry_dirs)
+                )
 
             logger.info(f"Removed {count} expired cache entries")
             return count
 
         except Exception as e:
             logger.error(f"Error clearing expired cache: {e}")
-            return count
+            return 0
+
+    def _clear_expired_dir(self, entry_dir: Path, now_ns: int) -> int:
+        """Remove expired entries from one shard; returns removal count."""
+        count = 0
+        # scandir yields cached stat results, avoiding a second stat
+        # syscall per entry that glob + Path.stat would incur
+        with os.scandir(entry_dir) as entries:
+            for entry in entries:
+                if entry.name == INDEX_FILE or not entry.is_file():
+                    continue
+                if not entry.name.endswith((".json", ".json.zst")):
+                    continue
+                if now_ns - entry.stat().st_mtime_ns > self.ttl_ns:
+                    os.unlink(entry.path)
+                    count += 1
+        return count
 
     def get_stats(self) -> Dict[str, any]:
         """
@@ -235,16 +765,30 @@ class ResultCache:
             Dictionary with cache statistics
         """
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
-            total_size = sum(f.stat().st_size for f in cache_files)
+            entry_dirs = self._entry_dirs()
+            with ThreadPoolExecutor(max_workers=min(8, len(entry_dirs))) as executor:
+                shard_stats = list(executor.map(self._dir_stats, entry_dirs))
 
             return {
                 "cache_dir": str(self.cache_dir),
-                "total_entries": len(cache_files),
-                "total_size_mb": total_size / (1024 * 1024),
+                "total_entries": sum(count for count, _ in shard_stats),
+                "total_size_mb": sum(size for _, size in shard_stats) / (1024 * 1024),
                 "ttl_days": self.ttl_days,
             }
 
         except Exception as e:
             logger.error(f"Error getting cache stats: {e}")
             return {}
+
+    @staticmethod
+    def _dir_stats(entry_dir: Path) -> Tuple[int, int]:
+        """Count cache entries and their total bytes in one shard."""
+        count = 0
+        total_size = 0
+        with os.scandir(entry_dir) as entries:
+            for entry in entries:
+                if ".json" not in entry.name or entry.name == INDEX_FILE or not entry.is_file():
+                    continue
+                count += 1
+                total_size += entry.stat().st_size
+        return count, total_size
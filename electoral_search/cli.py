@@ -2,10 +2,14 @@
 Command-line interface for electoral search tool.
 """
 
+import csv
 import logging
 import os
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 import typer
 from rich.console import Console
@@ -17,71 +21,131 @@ from .config import (
     FUZZY_THRESHOLD_DEFAULT,
     MAX_NAMES_FILE_SIZE_MB,
     MAX_SEARCH_NAMES,
+    MAX_TASKS_PER_CHILD,
     ProcessingStats,
     setup_logging,
 )
 from .export import export_results
 from .ocr import process_pdf
-from .parallel import get_optimal_workers
+from .parallel import get_mp_context, get_optimal_workers
 from .types import SearchResult
-from .validation import validate_path_security
+from .validation import configure_validation_memo, validate_path_security
 
 logger = logging.getLogger(__name__)
 console = Console()
 app = typer.Typer(help="Search Bengali Electoral Roll PDFs")
 
 
+# Per-process invariants installed by _init_worker; read by every task
+_worker_config: dict = {}
+
+
+def _init_worker(
+    search_names: Sequence[str],
+    names_hash: str,
+    threshold: int,
+    cache_dir: Optional[str],
+    use_cache: bool,
+    strict_cache: bool,
+    box_level: bool,
+    min_confidence: float,
+) -> None:
+    """
+    Pool initializer: receive run-wide invariants once per worker process.
+
+    search_names (up to MAX_SEARCH_NAMES Bengali strings) and the other
+    per-run settings used to be pickled into every task tuple; shipping
+    them once at worker start removes that per-PDF IPC cost.
+    """
+    # One OpenMP thread per tesseract: N workers each spinning up their
+    # own OpenMP pool oversubscribes every core. setdefault so users who
+    # tuned OMP_THREAD_LIMIT themselves keep their value.
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+    cache = None
+    if use_cache:
+        cache_path = Path(cache_dir) if cache_dir else None
+        cache = ResultCache(cache_dir=cache_path, strict_hash=strict_cache)
+
+    _worker_config.update(
+        search_names=search_names,
+        names_hash=names_hash,
+        threshold=threshold,
+        cache=cache,
+        box_level=box_level,
+        min_confidence=min_confidence,
+    )
+
+
 # Module-level worker function for multiprocessing (must be picklable)
 def _process_pdf_worker(
-    args: Tuple[Path, List[str], int, Optional[str], bool, bool, float],
-) -> List[SearchResult]:
+    task: Tuple[Path, Optional[str]],
+) -> Tuple[str, List[SearchResult], ProcessingStats, Optional[str]]:
     """
     Worker function for parallel PDF processing.
 
     This function is defined at module level to be picklable for
-    multiprocessing. Each worker process creates its own cache instance.
+    multiprocessing; run-wide settings come from _init_worker, so each
+    task carries only what varies per PDF. Errors are returned rather
+    than raised so one bad PDF cannot break the pool's result iteration.
 
     Args:
-        args: Tuple of (pdf_path, search_names, threshold, cache_dir,
-              use_cache, box_level, min_confidence)
+        task: Tuple of (pdf_path, file_hash); file_hash may be None when
+              the parent did not hash the file (cache disabled)
 
     Returns:
-        List of search results
+        Tuple of (pdf name, search results, worker stats, error or None)
     """
-    (pdf_path, search_names, threshold, cache_dir, use_cache, box_level, min_confidence) = args
+    pdf_path, file_hash = task
+    cfg = _worker_config
 
-    # Create cache instance in worker process if needed
-    cache = None
-    if use_cache:
-        cache_path = Path(cache_dir) if cache_dir else None
-        cache = ResultCache(cache_dir=cache_path)
+    # Per-task stats travel back with the result so page counts from
+    # workers are merged into the run totals instead of being discarded
+    worker_stats = ProcessingStats()
 
-    # Try cache first
-    if cache:
-        cached_results = cache.get(pdf_path, search_names, threshold)
-        if cached_results is not None:
-            return cached_results
+    try:
+        # Process PDF; the cache doubles as a voter store so a changed
+        # name list reuses the OCR output of earlier runs
+        results = process_pdf(
+            pdf_path,
+            cfg["search_names"],
+            cfg["threshold"],
+            worker_stats,
+            cfg["box_level"],
+            cfg["min_confidence"],
+            voter_cache=cfg["cache"],
+            file_hash=file_hash,
+        )
 
-    # Create a local stats object for this worker
-    worker_stats = ProcessingStats()
+        # Cache results. Lookups already happened in the parent
+        # (_prefetch_cached_results); workers only store.
+        cache = cfg["cache"]
+        if cache:
+            cache.set(
+                pdf_path,
+                cfg["search_names"],
+                cfg["threshold"],
+                results,
+                names_hash=cfg["names_hash"],
+                file_hash=file_hash,
+            )
+
+        return pdf_path.name, results, worker_stats, None
 
-    # Process PDF
-    results = process_pdf(
-        pdf_path, search_names, threshold, worker_stats, box_level, min_confidence
-    )
+    except Exception as e:
+        return pdf_path.name, [], worker_stats, str(e)
 
-    # Cache results
-    if cache:
-        cache.set(pdf_path, search_names, threshold, results)
 
-    return results
+# Memoized wrapper: the same user-supplied path is validated more than
+# once per invocation, and each validation costs realpath/stat syscalls
+_validate_path_cached = lru_cache(maxsize=128)(validate_path_security)
 
 
 def _validate_inputs(directory: str, names_file: str) -> Tuple[Path, Path]:
     """Validate input paths for security and existence."""
     # Validate directory
     try:
-        dir_path = validate_path_security(directory)
+        dir_path = _validate_path_cached(directory)
         if not dir_path.exists():
             console.print(f"[red]Directory not found: {directory}[/red]")
             raise typer.Exit(1)
@@ -94,7 +158,7 @@ def _validate_inputs(directory: str, names_file: str) -> Tuple[Path, Path]:
 
     # Validate names file
     try:
-        names_path = validate_path_security(names_file)
+        names_path = _validate_path_cached(names_file)
         if not names_path.exists():
             console.print(f"[red]Names file not found: {names_file}[/red]")
             raise typer.Exit(1) from None
@@ -105,8 +169,15 @@ def _validate_inputs(directory: str, names_file: str) -> Tuple[Path, Path]:
     return dir_path, names_path
 
 
-def _load_search_names(names_path: Path) -> List[str]:
-    """Load and validate search names from file."""
+def _load_search_names(names_path: Path) -> Tuple[str, ...]:
+    """
+    Load and validate search names from file.
+
+    Returns a deduplicated, sorted tuple: user files commonly repeat
+    names, and every duplicate would otherwise be normalized and scored
+    on every voter of every page. The tuple is immutable, so it is safe
+    to share with worker processes without defensive copies.
+    """
     # Check file size
     size_mb = names_path.stat().st_size / (1024 * 1024)
     if size_mb > MAX_NAMES_FILE_SIZE_MB:
@@ -134,17 +205,51 @@ def _load_search_names(names_path: Path) -> List[str]:
         )
         search_names = search_names[:MAX_SEARCH_NAMES]
 
-    logger.info(f"Loaded {len(search_names)} names to search")
-    return search_names
+    unique_names = tuple(sorted(set(search_names)))
+    if len(unique_names) < len(search_names):
+        logger.info(f"Dropped {len(search_names) - len(unique_names)} duplicate names")
+
+    logger.info(f"Loaded {len(unique_names)} names to search")
+    return unique_names
+
+
+def _iter_pdfs(root: str):
+    """
+    Yield PDF paths beneath root via an iterative scandir walk.
+
+    scandir reuses the dirent type info (no extra stat per entry) and
+    only the 4-byte suffix is lowercased, not the whole name. Unreadable
+    directories are logged and skipped. Batched-statx (io_uring) style
+    discovery was considered and rejected: it needs a native dependency
+    and only pays off on cold NFS caches, while this walk is already
+    syscall-minimal.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Paths of PDF files in arbitrary order
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    # Directories: don't follow symlinks, which avoids
+                    # walking into loops. Files: do follow, so a
+                    # symlinked PDF is found just as os.walk used to
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name[-4:].lower() == ".pdf" and entry.is_file():
+                        yield Path(entry.path)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {current}: {e}")
 
 
 def _find_targets(directory: Path) -> List[Path]:
     """Find all PDF files in the directory."""
-    pdf_files: List[Path] = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.lower().endswith(".pdf"):
-                pdf_files.append(Path(root) / file)
+    pdf_files = list(_iter_pdfs(str(directory)))
 
     if not pdf_files:
         console.print(f"[yellow]No PDF files found in {directory}[/yellow]")
@@ -156,7 +261,7 @@ def _find_targets(directory: Path) -> List[Path]:
 
 def _process_sequential(
     pdf_files: List[Path],
-    search_names: List[str],
+    search_names: Sequence[str],
     threshold: int,
     stats: ProcessingStats,
     cache: Optional[ResultCache],
@@ -189,9 +294,16 @@ def _process_sequential(
                         progress.advance(task)
                         continue
 
-                # Process PDF
+                # Process PDF; cache hits above skip it, and the voter
+                # cache lets a changed name list reuse the OCR output
                 results = process_pdf(
-                    pdf_path, search_names, threshold, stats, box_level, min_confidence
+                    pdf_path,
+                    search_names,
+                    threshold,
+                    stats,
+                    box_level,
+                    min_confidence,
+                    voter_cache=cache,
                 )
                 all_results.extend(results)
 
@@ -211,32 +323,113 @@ def _process_sequential(
     return all_results
 
 
-def _process_parallel(
+def _prefetch_cached_results(
     pdf_files: List[Path],
-    search_names: List[str],
+    search_names: Sequence[str],
+    names_hash: str,
+    threshold: int,
+    cache: ResultCache,
+    stats: ProcessingStats,
+) -> Tuple[List[SearchResult], List[Tuple[Path, Optional[str]]]]:
+    """
+    Look up all PDFs in the cache from the main process.
+
+    Hashing and cache reads release the GIL, so a small thread pool
+    overlaps the IO. Only cache misses need to go to the worker pool;
+    each miss carries the file hash already computed here so workers
+    don't hash the same file a second time when storing results.
+
+    Returns:
+        Tuple of (results from cache hits, (pdf, file_hash) cache
+        misses); file_hash is None when the file could not be read, in
+        which case the worker surfaces the real error
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    hit_results: List[SearchResult] = []
+    misses: List[Tuple[Path, Optional[str]]] = []
+
+    def _lookup(pdf: Path) -> Tuple[Optional[List[SearchResult]], Optional[str]]:
+        # An unreadable or vanished file is treated as a plain miss
+        # with no hash: the worker retries the read and reports the
+        # real error without stopping the batch
+        try:
+            cached = cache.get(pdf, search_names, threshold, names_hash=names_hash)
+            if cached is not None:
+                return cached, None
+            # Memo hit: the get() above already hashed this file
+            return None, cache.compute_file_hash(pdf)
+        except OSError as e:
+            logger.warning(f"Cache prefetch skipped for {pdf.name}: {e}")
+            return None, None
+
+    workers = min(8, max(1, len(pdf_files)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        lookups = executor.map(_lookup, pdf_files)
+
+        for pdf_path, (cached, file_hash) in zip(pdf_files, lookups):
+            if cached is None:
+                misses.append((pdf_path, file_hash))
+            else:
+                hit_results.extend(cached)
+                stats.files_processed += 1
+                stats.matches_found += len(cached)
+
+    if hit_results or len(misses) < len(pdf_files):
+        logger.info(f"Cache prefetch: {len(pdf_files) - len(misses)} hits, {len(misses)} misses")
+
+    return hit_results, misses
+
+
+def _process_parallel(
+    pdf_files: List[Tuple[Path, Optional[str]]],
+    search_names: Sequence[str],
+    names_hash: str,
     threshold: int,
     stats: ProcessingStats,
     workers: Optional[int],
     cache_dir: Optional[str],
     use_cache: bool,
+    strict_cache: bool,
     box_level: bool,
     min_confidence: float,
-) -> List[SearchResult]:
-    """Process PDFs in parallel."""
-    # Local import to avoid circular dependency issues
-    from concurrent.futures import ProcessPoolExecutor, as_completed
+    all_results: List[SearchResult],
+) -> None:
+    """
+    Process PDFs in parallel, appending to all_results as PDFs complete.
 
+    Each entry of pdf_files is (path, file_hash) where file_hash may be
+    None if the parent did not hash the file (cache disabled).
+    """
     num_workers = get_optimal_workers(workers)
     console.print(
         f"[cyan]Processing {len(pdf_files)} PDFs with "
         f"{num_workers} workers (parallel mode)[/cyan]"
     )
 
-    all_results: List[SearchResult] = []
-    worker_args = [
-        (pdf, search_names, threshold, cache_dir, use_cache, box_level, min_confidence)
-        for pdf in pdf_files
-    ]
+    # Largest files first (LPT scheduling) so one giant PDF does not end
+    # up as the last task holding the whole pool open
+    def _size_of(entry: Tuple[Path, Optional[str]]) -> int:
+        try:
+            return entry[0].stat().st_size
+        except OSError:
+            return 0
+
+    pdf_files = sorted(pdf_files, key=_size_of, reverse=True)
+
+    # Batch task dispatch to amortize per-task IPC overhead
+    chunksize = max(1, len(pdf_files) // (num_workers * 4))
+
+    init_args = (
+        search_names,
+        names_hash,
+        threshold,
+        cache_dir,
+        use_cache,
+        strict_cache,
+        box_level,
+        min_confidence,
+    )
 
     with Progress(
         SpinnerColumn(),
@@ -245,40 +438,56 @@ def _process_parallel(
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         TimeRemainingColumn(),
         console=console,
+        refresh_per_second=4,
     ) as progress:
         task = progress.add_task(f"Processing {len(pdf_files)} PDFs...", total=len(pdf_files))
 
-        with ProcessPoolExecutor(max_workers=num_workers) as executor:
-            future_to_pdf = {
-                executor.submit(_process_pdf_worker, args): args[0] for args in worker_args
-            }
-
-            for future in as_completed(future_to_pdf):
-                pdf_path = future_to_pdf[future]
-                progress.update(task, description=f"Processing {pdf_path.name}...")
-
-                try:
-                    results = future.result()
+        # Throttle bar updates to <=10 Hz: every update takes Rich's draw
+        # lock, and cached/small PDFs can complete thousands per second
+        pending_advance = 0
+        last_draw = time.monotonic()
+
+        # Recycle workers periodically: PIL/poppler buffers fragment the
+        # heap over many PDFs and a fresh process returns that memory
+        with get_mp_context().Pool(
+            num_workers,
+            initializer=_init_worker,
+            initargs=init_args,
+            maxtasksperchild=MAX_TASKS_PER_CHILD,
+        ) as pool:
+            for pdf_name, results, worker_stats, error in pool.imap_unordered(
+                _process_pdf_worker, pdf_files, chunksize=chunksize
+            ):
+                stats.merge(worker_stats)
+                if error is None:
                     all_results.extend(results)
-                    stats.files_processed += 1
-                    stats.matches_found += len(results)
-                except (ValueError, RuntimeError) as e:
-                    logger.error(f"Failed to process {pdf_path.name}: {e}")
-                    stats.files_failed += 1
-                    stats.errors.append(f"{pdf_path.name}: {str(e)}")
-                except Exception as e:
-                    logger.error(f"Unexpected error on {pdf_path.name}: {e}")
-                    stats.files_failed += 1
-                    stats.errors.append(f"{pdf_path.name}: {str(e)}")
-                finally:
-                    progress.advance(task)
-
-    return all_results
+                else:
+                    logger.error(f"Failed to process {pdf_name}: {error}")
+                    if not worker_stats.files_failed:
+                        # process_pdf records its own failures; only count
+                        # errors raised outside it (e.g. cache writes)
+                        stats.files_failed += 1
+                        stats.errors.append(f"{pdf_name}: {error}")
+
+                pending_advance += 1
+                now = time.monotonic()
+                if now - last_draw > 0.1:
+                    progress.update(
+                        task,
+                        advance=pending_advance,
+                        description=f"Processed {pdf_name}...",
+                    )
+                    pending_advance = 0
+                    last_draw = now
+
+        if pending_advance:
+            progress.advance(task, pending_advance)
 
 
 def _execute_processing(
     pdf_files: List[Path],
-    search_names: List[str],
+    search_names: Sequence[str],
+    names_hash: str,
     threshold: int,
     stats: ProcessingStats,
     parallel: bool,
@@ -286,22 +495,44 @@ def _execute_processing(
     cache: Optional[ResultCache],
     cache_dir: Optional[str],
     use_cache: bool,
+    strict_cache: bool,
     box_level: bool,
     min_confidence: float,
 ) -> List[SearchResult]:
     """Execute the appropriate processing strategy."""
     if parallel and len(pdf_files) > 1:
-        return _process_parallel(
-            pdf_files,
+        # One result list for the whole run; cache hits and worker output
+        # stream into it incrementally instead of being concatenated at
+        # the end
+        all_results: List[SearchResult] = []
+
+        # Resolve cache hits in the parent so workers only see misses;
+        # misses carry the hash computed during the lookup
+        if cache:
+            hit_results, pending = _prefetch_cached_results(
+                pdf_files, search_names, names_hash, threshold, cache, stats
+            )
+            all_results.extend(hit_results)
+            if not pending:
+                return all_results
+        else:
+            pending = [(pdf, None) for pdf in pdf_files]
+
+        _process_parallel(
+            pending,
             search_names,
+            names_hash,
             threshold,
             stats,
             workers,
             cache_dir,
             use_cache,
+            strict_cache,
             box_level,
             min_confidence,
+            all_results,
         )
+        return all_results
     else:
         if not parallel:
             console.print(f"[cyan]Processing {len(pdf_files)} PDFs (sequential mode)[/cyan]")
@@ -310,6 +541,23 @@ def _execute_processing(
         )
 
 
+# Above this many matches the results are printed as CSV instead of a
+# Rich table
+LARGE_RESULT_THRESHOLD = 500
+
+
+def _result_rows(all_results: List[SearchResult], box_level: bool) -> List[Tuple[str, ...]]:
+    """Pre-format results into plain string rows for table/CSV output."""
+    rows = []
+    for result in all_results:
+        row = (result["file"], str(result["page"]), result["name"], result["father"])
+        if box_level:
+            conf = result.get("confidence")
+            row += (f"{conf:.1f}%" if conf is not None else "N/A",)
+        rows.append(row)
+    return rows
+
+
 def _display_results(
     all_results: List[SearchResult],
     stats: ProcessingStats,
@@ -322,24 +570,36 @@ def _display_results(
     """Display final table, stats, and export results."""
     # 1. Results Table
     if all_results:
-        table = Table(title=f"Electoral Roll Matches ({len(all_results)} found)")
-        table.add_column("PDF File", style="cyan")
-        table.add_column("Page", justify="right", style="magenta")
-        table.add_column("Name", style="green")
-        table.add_column("Father / Guardian", style="yellow")
-
-        if box_level:
-            table.add_column("Confidence", justify="right", style="blue")
+        if len(all_results) > LARGE_RESULT_THRESHOLD:
+            # Rich re-measures column widths on every add_row, which goes
+            # quadratic on big tables; past this size plain CSV on stdout
+            # is both faster and more useful (it pipes cleanly)
+            console.print(
+                f"[cyan]{len(all_results)} matches; printing as CSV "
+                f"(use -o to save to a file)[/cyan]"
+            )
+            writer = csv.writer(sys.stdout)
+            header = ["file", "page", "name", "father"]
+            if box_level:
+                header.append("confidence")
+            writer.writerow(header)
+            writer.writerows(_result_rows(all_results, box_level))
+        else:
+            table = Table(title=f"Electoral Roll Matches ({len(all_results)} found)")
+            table.add_column("PDF File", style="cyan")
+            table.add_column("Page", justify="right", style="magenta")
+            table.add_column("Name", style="green")
+            table.add_column("Father / Guardian", style="yellow")
 
-        for result in all_results:
-            row_data = [result["file"], str(result["page"]), result["name"], result["father"]]
             if box_level:
-                conf = result.get("confidence")
-                # Handle possible None confidence or missing key
-                row_data.append(f"{conf:.1f}%" if conf is not None else "N/A")
-            table.add_row(*row_data)
+                table.add_column("Confidence", justify="right", style="blue")
 
-        console.print(table)
+            # Pre-format every cell to a plain str in one pass; add_row
+            # then only appends, with no per-row formatting work
+            for row in _result_rows(all_results, box_level):
+                table.add_row(*row)
+
+            console.print(table)
 
         # Export results if requested
         if output:
@@ -419,6 +679,11 @@ def search(
         None, "--cache-dir", help="Cache directory (default: ~/.electoral_search_cache)"
     ),
     clear_cache: bool = typer.Option(False, "--clear-cache", help="Clear cache before processing"),
+    strict_cache: bool = typer.Option(
+        False,
+        "--strict-cache",
+        help="Hash full file contents for cache keys (slower, collision-proof)",
+    ),
     box_level: bool = typer.Option(
         False, "--box-level", help="Enable box-level OCR with bounding boxes"
     ),
@@ -473,11 +738,14 @@ def search(
         dir_path, names_path = _validate_inputs(directory, names_file)
         search_names = _load_search_names(names_path)
 
+        # Hash the name list once; reused for every per-PDF cache key
+        names_hash = ResultCache.compute_names_hash(search_names)
+
         # 2. Cache Initialization
         cache = None
         if use_cache:
             cache_path = Path(cache_dir) if cache_dir else None
-            cache = ResultCache(cache_dir=cache_path)
+            cache = ResultCache(cache_dir=cache_path, strict_hash=strict_cache)
             if clear_cache:
                 cleared = cache.clear()
                 console.print(f"[yellow]Cleared {cleared} cache entries[/yellow]")
@@ -487,6 +755,10 @@ def search(
             c_stats = cache.get_stats()
             logger.info(f"Cache: {c_stats['total_entries']} entries")
 
+        # The header-validation memo persists alongside the result cache
+        # and stays in-memory when caching is disabled
+        configure_validation_memo(cache.cache_dir if cache else None)
+
         # 3. Discovery
         pdf_files = _find_targets(dir_path)
 
@@ -494,6 +766,7 @@ def search(
         all_results = _execute_processing(
             pdf_files,
             search_names,
+            names_hash,
             threshold,
             stats,
             parallel,
@@ -501,6 +774,7 @@ def search(
             cache,
             cache_dir,
             use_cache,
+            strict_cache,
             box_level,
             min_confidence,
         )
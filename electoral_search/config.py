@@ -7,6 +7,7 @@ All configuration values can be overridden via environment variables.
 import logging
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List
 
 # OCR Configuration
@@ -14,22 +15,49 @@ DPI = int(os.getenv("OCR_DPI", "350"))  # Image resolution for OCR
 OCR_LANG = os.getenv("OCR_LANG", "ben")  # Tesseract language (Bengali)
 OCR_CONFIG = "--psm 6"  # Page Segmentation Mode: uniform text block
 FUZZY_THRESHOLD_DEFAULT = 82  # Default similarity threshold (0-100)
+# Threads poppler may use per PDF rasterization. Default 1: the worker
+# pool already claims every core, so more threads here just oversubscribe.
+# Raise it (e.g. to cpu_count) for sequential runs of large PDFs.
+PDF_CONVERT_THREADS = int(os.getenv("PDF_CONVERT_THREADS", "1"))
+# pdftocairo is usually faster than pdftoppm; set PDF_USE_CAIRO=0 to
+# fall back if a corpus renders differently under cairo
+PDF_USE_CAIRO = os.getenv("PDF_USE_CAIRO", "1") != "0"
+# Pages rasterized per convert_from_path call. Chunking caps peak memory
+# at roughly PDF_PAGE_CHUNK x page_bytes regardless of document length,
+# instead of holding every page image of a PDF in memory at once.
+PDF_PAGE_CHUNK = int(os.getenv("PDF_PAGE_CHUNK", "4"))
+# Opt-in page preprocessing before OCR: grayscale + autocontrast and a
+# 2000 px cap, cutting tesseract input bytes ~4x on high-DPI scans.
+# Off by default; downsizing can cost accuracy on degraded originals.
+OCR_PREPROCESS = os.getenv("OCR_PREPROCESS", "0") == "1"
+# Pages of one PDF OCR'd concurrently (pytesseract path only). Default 1:
+# the worker pool already saturates the cores in parallel mode; raise it
+# for sequential runs, where each tesseract subprocess is a free core.
+OCR_PAGE_WORKERS = int(os.getenv("OCR_PAGE_WORKERS", "1"))
 
 # Security & Resource Limits
 MAX_PDF_SIZE_MB = int(os.getenv("MAX_PDF_SIZE_MB", "50"))
 MAX_PDF_PAGES = int(os.getenv("MAX_PDF_PAGES", "100"))
 MAX_NAMES_FILE_SIZE_MB = int(os.getenv("MAX_NAMES_FILE_SIZE_MB", "10"))
 MAX_SEARCH_NAMES = int(os.getenv("MAX_SEARCH_NAMES", "1000"))
+# Worker processes are recycled after this many PDFs to return memory
+# held by Tesseract/PIL buffers to the OS
+MAX_TASKS_PER_CHILD = int(os.getenv("ELECTORAL_MAXTASKS", "20"))
 
 # Logging Configuration
 LOG_FILE = "electoral_search.log"
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
 
+@lru_cache(maxsize=2)
 def setup_logging(verbose: bool = False) -> logging.Logger:
     """
     Configure logging for the application.
 
+    Memoized per verbose flag: repeated calls (tests, REPL sessions,
+    multiple commands) used to append duplicate handlers and amplify
+    every log line once per call.
+
     Args:
         verbose: Enable debug logging if True
 
@@ -50,12 +78,25 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
     return logger
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingStats:
-    """Statistics for processing session."""
+    """
+    Statistics for processing session.
+
+    Slotted: the counters are bumped once per page/file in hot loops, and
+    slot access skips the per-instance __dict__.
+    """
 
     files_processed: int = 0
     files_failed: int = 0
     pages_processed: int = 0
     matches_found: int = 0
     errors: List[str] = field(default_factory=list)
+
+    def merge(self, other: "ProcessingStats") -> None:
+        """Fold another stats object (e.g. from a worker) into this one."""
+        self.files_processed += other.files_processed
+        self.files_failed += other.files_failed
+        self.pages_processed += other.pages_processed
+        self.matches_found += other.matches_found
+        self.errors.extend(other.errors)
@@ -12,8 +12,19 @@ from typing import List
 
 from .types import SearchResult
 
+try:
+    import orjson  # type: ignore
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Export files are written through a 1 MiB buffer so large dumps issue
+# few big writes instead of many small ones
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 def export_to_json(results: List[SearchResult], output_path: Path) -> None:
     """
@@ -28,9 +39,21 @@ def export_to_json(results: List[SearchResult], output_path: Path) -> None:
     Raises:
         IOError: If file cannot be written
     """
+    if not results:
+        # Single sentinel write: skips serializer and text-layer setup
+        output_path.write_bytes(b"[]")
+        logger.info(f"Exported 0 results to JSON: {output_path}")
+        return
+
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        if _HAS_ORJSON:
+            # orjson serializes straight to UTF-8 bytes; writing those in
+            # binary mode skips the text-layer encoding round-trip
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
 
         logger.info(f"Exported {len(results)} results to JSON: {output_path}")
 
@@ -53,59 +76,47 @@ def export_to_csv(results: List[SearchResult], output_path: Path) -> None:
     Raises:
         IOError: If file cannot be written
     """
+    if not results:
+        # Header-only sentinel write: skips the csv machinery entirely
+        output_path.write_bytes(b"file,page,name,father\r\n")
+        logger.info(f"Exported 0 results to CSV: {output_path}")
+        return
+
     try:
-        with open(output_path, "w", encoding="utf-8", newline="") as f:
-            if not results:
-                # Write header only for empty results
-                writer = csv.DictWriter(f, fieldnames=["file", "page", "name", "father"])
-                writer.writeheader()
-                logger.info(f"Exported 0 results to CSV: {output_path}")
-                return
-
-            # Determine if we have bbox data
+        with open(
+            output_path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE
+        ) as f:
+            writer = csv.writer(f)
+
+            # Decide the schema once; every row then projects to a plain
+            # tuple for csv.writer, avoiding DictWriter's per-row
+            # dict-to-list conversion and the transient row dicts
             has_bbox = any("bbox" in result for result in results)
             has_confidence = any("confidence" in result for result in results)
 
-            # Prepare fieldnames
-            fieldnames = ["file", "page", "name", "father"]
+            header = ["file", "page", "name", "father"]
             if has_bbox:
-                fieldnames.extend(["bbox_left", "bbox_top", "bbox_width", "bbox_height"])
+                header.extend(["bbox_left", "bbox_top", "bbox_width", "bbox_height"])
             if has_confidence:
-                fieldnames.append("confidence")
-
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            # Write rows with bbox data expanded
-            for result in results:
-                row = {
-                    "file": result["file"],
-                    "page": result["page"],
-                    "name": result["name"],
-                    "father": result["father"],
-                }
-
-                # Add bbox columns if present
-                if has_bbox and "bbox" in result and result["bbox"]:
-                    bbox = result["bbox"]
-                    row["bbox_left"] = bbox["left"]
-                    row["bbox_top"] = bbox["top"]
-                    row["bbox_width"] = bbox["width"]
-                    row["bbox_height"] = bbox["height"]
-                elif has_bbox:
-                    # Empty bbox data
-                    row["bbox_left"] = ""
-                    row["bbox_top"] = ""
-                    row["bbox_width"] = ""
-                    row["bbox_height"] = ""
-
-                # Add confidence if present
+                header.append("confidence")
+            writer.writerow(header)
+
+            empty_bbox = ("", "", "", "")
+
+            def to_row(result: SearchResult) -> tuple:
+                row = (result["file"], result["page"], result["name"], result["father"])
+                if has_bbox:
+                    bbox = result.get("bbox")
+                    if bbox:
+                        row += (bbox["left"], bbox["top"], bbox["width"], bbox["height"])
+                    else:
+                        row += empty_bbox
                 if has_confidence:
-                    row["confidence"] = (
-                        f"{result['confidence']:.2f}" if "confidence" in result else ""
-                    )
+                    conf = result.get("confidence")
+                    row += (f"{conf:.2f}" if conf is not None else "",)
+                return row
 
-                writer.writerow(row)
+            writer.writerows(to_row(result) for result in results)
 
         logger.info(f"Exported {len(results)} results to CSV: {output_path}")
 
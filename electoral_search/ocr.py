@@ -5,21 +5,180 @@ Handles PDF to image conversion and Tesseract OCR processing.
 """
 
 import logging
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .cache import ResultCache
 
 import pytesseract
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, pdfinfo_from_path
 from pdf2image.exceptions import PDFPageCountError, PDFSyntaxError
 from pytesseract import Output
 
-from .config import DPI, MAX_PDF_PAGES, OCR_CONFIG, OCR_LANG, ProcessingStats
-from .text_processing import extract_voter_blocks, extract_voter_blocks_with_boxes, fuzzy_match
-from .types import BoundingBox, OCRWord, SearchResult
+from .config import (
+    DPI,
+    MAX_PDF_PAGES,
+    OCR_CONFIG,
+    OCR_LANG,
+    OCR_PAGE_WORKERS,
+    OCR_PREPROCESS,
+    PDF_CONVERT_THREADS,
+    PDF_PAGE_CHUNK,
+    PDF_USE_CAIRO,
+    ProcessingStats,
+)
+from .text_processing import (
+    extract_voter_blocks,
+    extract_voter_blocks_with_boxes,
+    match_name_indices,
+    normalize_bn,
+)
+from .types import BoundingBox, OCRWord, SearchResult, VoterInfo
 from .validation import validate_pdf_file
 
+try:
+    import tesserocr  # type: ignore
+
+    _HAS_TESSEROCR = True
+except ImportError:
+    _HAS_TESSEROCR = False
+
 logger = logging.getLogger(__name__)
 
+# Per-page OCR deadline (seconds), enforced on both engines: pytesseract
+# takes it directly, tesserocr via the Recognize() timeout in ms
+_OCR_TIMEOUT_SECONDS = 30
+
+# Pages wider than this are downscaled by the optional preprocessor
+_PREPROCESS_MAX_WIDTH = 2000
+
+# Long-lived Tesseract API handle (tesserocr path), one per process
+_tess_api = None
+
+
+def _preprocess_image(image):
+    """
+    Lighten a page image before OCR (opt-in via OCR_PREPROCESS).
+
+    Grayscale halves-to-quarters the bytes Tesseract reads, autocontrast
+    normalizes faded scans, and very wide pages are capped at 2000 px —
+    OCR cost scales with pixel count, so oversized scans pay quadratic
+    time for no accuracy gain on clean originals.
+
+    Args:
+        image: PIL Image object
+
+    Returns:
+        Preprocessed PIL Image (the original is closed if replaced)
+    """
+    from PIL import Image as PILImage
+    from PIL import ImageOps
+
+    processed = ImageOps.autocontrast(image.convert("L"))
+    if processed.width > _PREPROCESS_MAX_WIDTH:
+        processed.thumbnail((_PREPROCESS_MAX_WIDTH, _PREPROCESS_MAX_WIDTH), PILImage.LANCZOS)
+    image.close()
+    return processed
+
+
+def _get_tess_api():
+    """Return the per-process tesserocr API, creating it on first use."""
+    global _tess_api
+    if _tess_api is None:
+        import atexit
+
+        _tess_api = tesserocr.PyTessBaseAPI(lang=OCR_LANG, psm=tesserocr.PSM.SINGLE_BLOCK)
+        atexit.register(_tess_api.End)
+    return _tess_api
+
+
+def _ocr_page_text(image) -> str:
+    """
+    OCR one page image to text.
+
+    With the optional tesserocr package installed, a single in-process
+    Tesseract API instance is reused across pages, so the language model
+    is loaded once per worker instead of once per page as with the
+    pytesseract subprocess (which also round-trips the image through a
+    temp file). Falls back to pytesseract otherwise.
+
+    Args:
+        image: PIL Image object
+
+    Returns:
+        OCR-extracted text
+    """
+    if _HAS_TESSEROCR:
+        api = _get_tess_api()
+        api.SetImage(image)
+        # Recognize takes a deadline in milliseconds and returns False
+        # when it was hit; raising with "timeout" in the message routes
+        # into the same skip-page handling as the pytesseract path
+        if not api.Recognize(_OCR_TIMEOUT_SECONDS * 1000):
+            raise RuntimeError(f"OCR timeout after {_OCR_TIMEOUT_SECONDS}s (tesserocr)")
+        return api.GetUTF8Text()
+
+    return pytesseract.image_to_string(
+        image,
+        lang=OCR_LANG,
+        config=OCR_CONFIG,
+        timeout=_OCR_TIMEOUT_SECONDS,
+    )
+
+
+def _iter_image_chunks(pdf_path: Path) -> Iterator[List[Tuple[int, "object"]]]:
+    """
+    Rasterize a PDF in chunks of PDF_PAGE_CHUNK pages.
+
+    convert_from_path with no page range materializes every page image
+    at once — roughly 100 MB per page at 350 DPI, so long documents hold
+    gigabytes before any OCR starts. Chunking bounds peak memory at
+    PDF_PAGE_CHUNK pages regardless of document length.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Yields:
+        Lists of (page_no, PIL Image) pairs, at most PDF_PAGE_CHUNK long
+
+    Raises:
+        ValueError: If the PDF is corrupted or its page count is invalid
+        RuntimeError: If rasterization fails
+    """
+    try:
+        info = pdfinfo_from_path(str(pdf_path))
+        page_count = int(info["Pages"])
+    except PDFPageCountError:
+        raise ValueError(f"Invalid PDF page count: {pdf_path.name}")
+    except PDFSyntaxError:
+        raise ValueError(f"Corrupted PDF file: {pdf_path.name}")
+    except Exception as e:
+        raise RuntimeError(f"Failed to read PDF info: {e}") from e
+
+    if page_count > MAX_PDF_PAGES:
+        logger.warning(f"PDF has {page_count} pages, limiting to {MAX_PDF_PAGES}")
+        page_count = MAX_PDF_PAGES
+
+    for first in range(1, page_count + 1, PDF_PAGE_CHUNK):
+        last = min(first + PDF_PAGE_CHUNK - 1, page_count)
+        try:
+            images = convert_from_path(
+                str(pdf_path),
+                dpi=DPI,
+                first_page=first,
+                last_page=last,
+                thread_count=PDF_CONVERT_THREADS,
+                use_pdftocairo=PDF_USE_CAIRO,
+            )
+        except (PDFPageCountError, PDFSyntaxError):
+            raise ValueError(f"Corrupted PDF file: {pdf_path.name}") from None
+        except Exception as e:
+            raise RuntimeError(f"Failed to convert PDF to images: {e}") from e
+
+        yield [(first + offset, image) for offset, image in enumerate(images)]
+
 
 def extract_ocr_data(image, min_confidence: float = 0) -> List[OCRWord]:
     """
@@ -38,7 +197,11 @@ def extract_ocr_data(image, min_confidence: float = 0) -> List[OCRWord]:
     try:
         # Get detailed OCR data including bounding boxes
         data = pytesseract.image_to_data(
-            image, lang=OCR_LANG, config=OCR_CONFIG, output_type=Output.DICT, timeout=30
+            image,
+            lang=OCR_LANG,
+            config=OCR_CONFIG,
+            output_type=Output.DICT,
+            timeout=_OCR_TIMEOUT_SECONDS,
         )
 
         ocr_words: List[OCRWord] = []
@@ -84,17 +247,172 @@ def get_text_bounding_box(ocr_words: List[OCRWord]) -> Optional[BoundingBox]:
     if not ocr_words:
         return None
 
-    # Find the extreme coordinates
-    min_left = min(word["bbox"]["left"] for word in ocr_words)
-    min_top = min(word["bbox"]["top"] for word in ocr_words)
-    max_right = max(word["bbox"]["left"] + word["bbox"]["width"] for word in ocr_words)
-    max_bottom = max(word["bbox"]["top"] + word["bbox"]["height"] for word in ocr_words)
+    # Find the extreme coordinates in a single pass over the words
+    first = ocr_words[0].bbox
+    min_left, min_top = first.left, first.top
+    max_right, max_bottom = min_left + first.width, min_top + first.height
+    for word in ocr_words[1:]:
+        bbox = word.bbox
+        left, top = bbox.left, bbox.top
+        right, bottom = left + bbox.width, top + bbox.height
+        if left < min_left:
+            min_left = left
+        if top < min_top:
+            min_top = top
+        if right > max_right:
+            max_right = right
+        if bottom > max_bottom:
+            max_bottom = bottom
 
     return BoundingBox(
         left=min_left, top=min_top, width=max_right - min_left, height=max_bottom - min_top
     )
 
 
+def _submit_chunk_ocr(chunk, use_page_threads):
+    """
+    Start threaded OCR for one chunk's pages, if it pays off.
+
+    Returns a list of futures aligned with the chunk, or None when the
+    chunk should be OCR'd inline. Exiting the executor's with-block
+    waits for completion; errors surface via future.result().
+    """
+    if use_page_threads and len(chunk) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(OCR_PAGE_WORKERS, len(chunk))) as executor:
+            return [executor.submit(_ocr_page_text, image) for _, image in chunk]
+    return None
+
+
+def _close_image(image) -> None:
+    """Close a page image to free memory, tolerating failures."""
+    if image:
+        try:
+            image.close()
+        except Exception:
+            logger.error("Failed to close image: %r", image)
+
+
+def extract_voter_pages(
+    pdf_path: Path, stats: ProcessingStats
+) -> List[Tuple[int, List[VoterInfo]]]:
+    """
+    OCR a PDF and extract voter blocks for every page (text-only path).
+
+    This is the expensive half of process_pdf, deliberately independent
+    of the search names and threshold: its output only depends on the
+    file contents and the OCR settings, so it can be cached per file and
+    reused when the name list changes.
+
+    Args:
+        pdf_path: Path to PDF file to process
+        stats: ProcessingStats object to track progress
+
+    Returns:
+        List of (page number, voters) pairs
+
+    Raises:
+        ValueError: If the PDF is corrupted
+        RuntimeError: If OCR or conversion fails critically
+    """
+    pages: List[Tuple[int, List[VoterInfo]]] = []
+
+    # Page OCR threads: each pytesseract call is a separate tesseract
+    # subprocess, so threads just overlap the waits. Skipped for
+    # tesserocr (one API handle, not thread-safe).
+    use_page_threads = not _HAS_TESSEROCR and OCR_PAGE_WORKERS > 1
+
+    # Pages stream in chunks instead of materializing the whole PDF
+    # up front; conversion errors propagate from the iterator
+    for chunk in _iter_image_chunks(pdf_path):
+        if OCR_PREPROCESS:
+            chunk = [(page_no, _preprocess_image(image)) for page_no, image in chunk]
+
+        chunk_futures = _submit_chunk_ocr(chunk, use_page_threads)
+
+        for idx, (page_no, image) in enumerate(chunk):
+            try:
+                if chunk_futures is not None:
+                    text = chunk_futures[idx].result()
+                else:
+                    text = _ocr_page_text(image)
+
+                stats.pages_processed += 1
+
+                # Extract voter information
+                voters = extract_voter_blocks(text)
+                logger.debug("Page %d: Extracted %d voters", page_no, len(voters))
+                pages.append((page_no, voters))
+
+            except pytesseract.TesseractNotFoundError:
+                raise RuntimeError(
+                    "Tesseract not found. Install: apt-get install tesseract-ocr tesseract-ocr-ben"
+                ) from None
+            except RuntimeError as e:
+                if "timeout" in str(e).lower():
+                    logger.warning("OCR timeout on page %d, skipping", page_no)
+                    continue
+                raise
+            except Exception as e:
+                logger.error("Error processing page %d: %s", page_no, e)
+                continue
+            finally:
+                # Cleanup image to free memory
+                _close_image(image)
+
+    return pages
+
+
+def match_voter_pages(
+    pdf_name: str,
+    pages: List[Tuple[int, List[VoterInfo]]],
+    search_names: List[str],
+    threshold: int,
+    stats: ProcessingStats,
+) -> List[SearchResult]:
+    """
+    Match already-extracted voters against the search names.
+
+    The cheap half of process_pdf: pure fuzzy matching, run both after a
+    fresh extraction and when extract_voter_pages output came from cache.
+
+    Args:
+        pdf_name: PDF file name for result rows
+        pages: (page number, voters) pairs from extract_voter_pages
+        search_names: List of names to search for
+        threshold: Fuzzy match threshold (0-100)
+        stats: ProcessingStats object to track progress
+
+    Returns:
+        List of SearchResult dictionaries containing matches
+    """
+    # Normalize queries once per PDF; the tuple is hashable so the
+    # matcher's per-run prefilter structures can be cached on it
+    normalized_queries = tuple(normalize_bn(q) for q in search_names)
+
+    # One shared string object for every result row: pickle only
+    # memoizes identical objects, keeping the IPC payload to one copy
+    pdf_name = sys.intern(pdf_name)
+
+    results: List[SearchResult] = []
+    for page_no, voters in pages:
+        # One result per matching query
+        for voter in voters:
+            for _ in match_name_indices(voter["name"], normalized_queries, threshold):
+                result = SearchResult(
+                    file=pdf_name,
+                    page=page_no,
+                    name=voter["name"],
+                    father=voter["father"],
+                )
+                results.append(result)
+                stats.matches_found += 1
+                logger.info("Match found: %s on page %d", voter["name"], page_no)
+
+    return results
+
+
 def process_pdf(
     pdf_path: Path,
     search_names: List[str],
@@ -102,6 +420,8 @@ def process_pdf(
     stats: ProcessingStats,
     box_level: bool = False,
     min_confidence: float = 60,
+    voter_cache: Optional["ResultCache"] = None,
+    file_hash: Optional[str] = None,
 ) -> List[SearchResult]:
     """
     Process a PDF file and search for matching names using OCR.
@@ -113,6 +433,10 @@ def process_pdf(
         stats: ProcessingStats object to track progress
         box_level: Enable bounding box extraction (default: False)
         min_confidence: Minimum OCR confidence threshold (default: 60)
+        voter_cache: Optional ResultCache persisting extracted voters per
+            file (text-only path); a hit skips OCR entirely and re-runs
+            only the matching phase
+        file_hash: Precomputed content hash for voter_cache lookups
 
     Returns:
         List of SearchResult dictionaries containing matches
@@ -129,114 +453,94 @@ def process_pdf(
 
         logger.info(f"Processing PDF: {pdf_path.name} (box_level={box_level})")
 
-        # Convert PDF to images with error handling
-        try:
-            images = convert_from_path(
-                str(pdf_path),
-                dpi=DPI,
-                thread_count=1,
-                use_pdftocairo=False,  # Limit resource usage
-            )
-        except PDFPageCountError:
-            raise ValueError(f"Invalid PDF page count: {pdf_path.name}")
-        except PDFSyntaxError:
-            raise ValueError(f"Corrupted PDF file: {pdf_path.name}")
-        except Exception as e:
-            raise RuntimeError(f"Failed to convert PDF to images: {e}") from e
-
-        # Check page limit
-        if len(images) > MAX_PDF_PAGES:
-            logger.warning(f"PDF has {len(images)} pages, limiting to {MAX_PDF_PAGES}")
-            images = images[:MAX_PDF_PAGES]
-
-        # Process each page
-        for page_no, image in enumerate(images, start=1):
-            try:
-                if box_level:
+        if not box_level:
+            # OCR is the dominant cost, so the extracted voters are
+            # cached independently of the search names: a changed name
+            # list or threshold reuses them and only re-matches
+            pages = None
+            if voter_cache is not None:
+                pages = voter_cache.get_voters(pdf_path, file_hash=file_hash)
+                if pages is not None:
+                    logger.info(f"Voter cache hit: {pdf_path.name}, skipping OCR")
+
+            if pages is None:
+                pages = extract_voter_pages(pdf_path, stats)
+                if voter_cache is not None:
+                    voter_cache.set_voters(pdf_path, pages, file_hash=file_hash)
+
+            results = match_voter_pages(pdf_path.name, pages, search_names, threshold, stats)
+            stats.files_processed += 1
+            return results
+
+        # Box-level path: bounding boxes are tied to page images, so it
+        # always OCRs and never consults the voter cache
+        normalized_queries = tuple(normalize_bn(q) for q in search_names)
+        pdf_name = sys.intern(pdf_path.name)
+
+        for chunk in _iter_image_chunks(pdf_path):
+            if OCR_PREPROCESS:
+                chunk = [(page_no, _preprocess_image(image)) for page_no, image in chunk]
+
+            for page_no, image in chunk:
+                try:
                     # Box-level OCR extraction
                     ocr_words = extract_ocr_data(image, min_confidence)
                     # Reconstruct text for pattern matching
-                    text = " ".join(word["text"] for word in ocr_words)
+                    text = " ".join(word.text for word in ocr_words)
 
                     stats.pages_processed += 1
 
                     # Extract voter information with bounding boxes
                     voters = extract_voter_blocks_with_boxes(text, ocr_words)
-                    logger.debug(f"Page {page_no}: Extracted {len(voters)} voters (box-level)")
-
-                    # Search for matches
-                    for voter in voters:
-                        for query in search_names:
-                            if fuzzy_match(voter["name"], query, threshold):
-                                # Get confidence if available
-                                avg_conf = voter.get("confidence")
-                                result = SearchResult(
-                                    file=pdf_path.name,
-                                    page=page_no,
-                                    name=voter["name"],
-                                    father=voter["father"],
-                                    bbox=voter.get("name_bbox"),
-                                    confidence=avg_conf,
-                                )
-                                results.append(result)
-                                stats.matches_found += 1
-                                if avg_conf:
-                                    logger.info(
-                                        f"Match found: {voter['name']} "
-                                        f"on page {page_no} "
-                                        f"(confidence: {avg_conf:.1f})"
-                                    )
-                                else:
-                                    logger.info(f"Match found: {voter['name']} on page {page_no}")
-                else:
-                    # Standard text-only OCR (backward compatible)
-                    text = pytesseract.image_to_string(
-                        image,
-                        lang=OCR_LANG,
-                        config=OCR_CONFIG,
-                        timeout=30,  # Timeout per page
-                    )
-
-                    stats.pages_processed += 1
+                    logger.debug("Page %d: Extracted %d voters (box-level)", page_no, len(voters))
 
-                    # Extract voter information
-                    voters = extract_voter_blocks(text)
-                    logger.debug(f"Page {page_no}: Extracted {len(voters)} voters")
-
-                    # Search for matches
+                    # Search for matches (one result per matching query)
                     for voter in voters:
-                        for query in search_names:
-                            if fuzzy_match(voter["name"], query, threshold):
-                                result = SearchResult(
-                                    file=pdf_path.name,
-                                    page=page_no,
-                                    name=voter["name"],
-                                    father=voter["father"],
+                        for _ in match_name_indices(voter["name"], normalized_queries, threshold):
+                            # Get confidence if available
+                            avg_conf = voter.get("confidence")
+                            name_bbox = voter.get("name_bbox")
+                            result = SearchResult(
+                                file=pdf_name,
+                                page=page_no,
+                                name=voter["name"],
+                                father=voter["father"],
+                                # Dict form: results round-trip through JSON
+                                bbox=name_bbox._asdict() if name_bbox else None,
+                                confidence=avg_conf,
+                            )
+                            results.append(result)
+                            stats.matches_found += 1
+                            if avg_conf:
+                                logger.info(
+                                    "Match found: %s on page %d (confidence: %.1f)",
+                                    voter["name"],
+                                    page_no,
+                                    avg_conf,
                                 )
-                                results.append(result)
-                                stats.matches_found += 1
-                                logger.info(f"Match found: {voter['name']} on page {page_no}")
-
-            except pytesseract.TesseractNotFoundError:
-                raise RuntimeError(
-                    "Tesseract not found. Install: apt-get install tesseract-ocr tesseract-ocr-ben"
-                )
-            except RuntimeError as e:
-                if "timeout" in str(e).lower():
-                    logger.warning(f"OCR timeout on page {page_no}, skipping")
+                            else:
+                                logger.info("Match found: %s on page %d", voter["name"], page_no)
+
+                except pytesseract.TesseractNotFoundError:
+                    raise RuntimeError(
+                        "Tesseract not found. Install: apt-get install tesseract-ocr tesseract-ocr-ben"
+                    ) from None
+                except RuntimeError as e:
+                    if "timeout" in str(e).lower():
+                        logger.warning("OCR timeout on page %d, skipping", page_no)
+                        continue
+                    raise
+                except Exception as e:
+                    logger.error("Error processing page %d: %s", page_no, e)
                     continue
-                raise
-            except Exception as e:
-                logger.error(f"Error processing page {page_no}: {e}")
-                continue
-            finally:
-                # Cleanup image to free memory
-                if image:
-                    try:
-                        image.close()
-                    except Exception:
-                        logger.error(f"Failed to close image: {image}")
-                        pass
+                finally:
+                    # Cleanup image to free memory
+                    if image:
+                        try:
+                            image.close()
+                        except Exception:
+                            logger.error("Failed to close image: %r", image)
+                            pass
 
         stats.files_processed += 1
         return results
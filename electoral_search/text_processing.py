@@ -6,9 +6,12 @@ Handles normalization, extraction, and fuzzy matching of Bengali text.
 
 import logging
 import re
-from typing import List
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from .types import BoundingBox, OCRWord, VoterInfo
 
@@ -18,13 +21,34 @@ logger = logging.getLogger(__name__)
 NAME_RE = re.compile(r"নাম\s*[:：]\s*(.{1,200}?)(?:\n|$)", re.MULTILINE)
 FATHER_RE = re.compile(r"(পিতার নাম|স্বামীর নাম)\s*[:：]\s*(.{1,200}?)(?:\n|$)", re.MULTILINE)
 
+# Combined single-pass pattern: a name line followed within the same
+# block (up to 3 intervening non-blank lines, e.g. a voter number) by a
+# father/husband line. The leading newline anchor keeps the bare "নাম"
+# from matching inside "পিতার নাম"; all quantifiers stay bounded.
+VOTER_RE = re.compile(
+    r"(?:^|\n)নাম\s*[:：]\s*(?P<name>.{1,200}?)\n"
+    r"(?:[^\n]{1,200}\n){0,3}?"
+    r"(?:পিতার নাম|স্বামীর নাম)\s*[:：]\s*(?P<father>.{1,200}?)(?:\n|$)"
+)
 
+# Translation table for normalize_bn, built once at import: visarga,
+# danda, halant and spaces are stripped before fuzzy matching
+_NORM_TABLE = str.maketrans("", "", "ঃ।্ ")
+
+
+@lru_cache(maxsize=1 << 16)
 def normalize_bn(text: str) -> str:
     """
     Normalize Bengali text for fuzzy matching.
 
     Removes diacritics and whitespace to improve matching accuracy
-    when dealing with OCR variations.
+    when dealing with OCR variations. Text is NFC-composed first, so
+    decomposed nukta clusters the OCR may emit (e.g. য + ় for য়)
+    collapse to the single code points used in typed search names —
+    the two spellings would otherwise never compare equal, and shorter
+    strings also mean smaller edit-distance matrices in the scorer.
+    Results are memoized: search names and common OCR tokens recur
+    across every page and PDF, so repeats become a dict lookup.
 
     Args:
         text: Bengali text to normalize
@@ -40,8 +64,7 @@ def normalize_bn(text: str) -> str:
         return ""
 
     # Use str.translate for better performance
-    translation_table = str.maketrans("", "", "ঃ।্ ")
-    return text.translate(translation_table).strip()
+    return unicodedata.normalize("NFC", text).translate(_NORM_TABLE).strip()
 
 
 def extract_voter_blocks(text: str) -> List[VoterInfo]:
@@ -66,26 +89,15 @@ def extract_voter_blocks(text: str) -> List[VoterInfo]:
         >>> extract_voter_blocks(text)
         [{'name': 'রহিম', 'father': 'করিম'}]
     """
-    voters: List[VoterInfo] = []
-    blocks = text.split("\n\n")
-
-    for block in blocks:
-        try:
-            name_match = NAME_RE.search(block)
-            father_match = FATHER_RE.search(block)
-
-            if name_match and father_match:
-                voters.append(
-                    VoterInfo(
-                        name=name_match.group(1).strip(),
-                        father=father_match.group(2).strip(),
-                    )
-                )
-        except Exception as e:
-            logger.debug(f"Failed to extract voter from block: {e}")
-            continue
-
-    return voters
+    # One finditer pass over the whole text replaces the old
+    # split-on-blank-line loop with two regex searches per block
+    return [
+        VoterInfo(
+            name=match.group("name").strip(),
+            father=match.group("father").strip(),
+        )
+        for match in VOTER_RE.finditer(text)
+    ]
 
 
 def extract_voter_blocks_with_boxes(text: str, ocr_words: List[OCRWord]) -> List[VoterInfo]:
@@ -104,8 +116,8 @@ def extract_voter_blocks_with_boxes(text: str, ocr_words: List[OCRWord]) -> List
 
     Example:
         >>> ocr_words = [
-        ...     {'text': 'নাম', 'confidence': 95, 'bbox': {...}},
-        ...     {'text': 'রহিম', 'confidence': 92, 'bbox': {...}}
+        ...     OCRWord(text='নাম', confidence=95, bbox=BoundingBox(...)),
+        ...     OCRWord(text='রহিম', confidence=92, bbox=BoundingBox(...)),
         ... ]
         >>> voters = extract_voter_blocks_with_boxes(text, ocr_words)
     """
@@ -114,12 +126,24 @@ def extract_voter_blocks_with_boxes(text: str, ocr_words: List[OCRWord]) -> List
     # First extract text blocks as usual
     text_voters = extract_voter_blocks(text)
 
+    # Normalize each OCR word once for the whole page; the voter loop
+    # below fuzzes every voter's tokens against every word, and without
+    # this the same word text would be renormalized per token. The exact
+    # index serves the common case (OCR read the token cleanly) in O(1),
+    # leaving the linear fuzzy scan for misread tokens only.
+    norm_words = [(word, normalize_bn(word.text)) for word in ocr_words]
+    by_norm: defaultdict = defaultdict(list)
+    for word, norm in norm_words:
+        by_norm[norm].append(word)
+    # Contiguous choices list for the batched scorer, built once per page
+    norm_texts = [norm for _, norm in norm_words]
+
     # For each text match, try to find corresponding words in OCR data
     for voter_text in text_voters:
         try:
             # Find name words in OCR data
-            name_words = _find_text_words(voter_text["name"], ocr_words)
-            father_words = _find_text_words(voter_text["father"], ocr_words)
+            name_words = _find_text_words(voter_text["name"], norm_words, norm_texts, by_norm)
+            father_words = _find_text_words(voter_text["father"], norm_words, norm_texts, by_norm)
 
             # Calculate bounding boxes
             name_bbox = _get_combined_bbox(name_words) if name_words else None
@@ -127,9 +151,7 @@ def extract_voter_blocks_with_boxes(text: str, ocr_words: List[OCRWord]) -> List
 
             # Calculate average confidence
             all_words = name_words + father_words
-            avg_conf = (
-                sum(w["confidence"] for w in all_words) / len(all_words) if all_words else None
-            )
+            avg_conf = sum(w.confidence for w in all_words) / len(all_words) if all_words else None
 
             voter = VoterInfo(
                 name=voter_text["name"],
@@ -147,7 +169,7 @@ def extract_voter_blocks_with_boxes(text: str, ocr_words: List[OCRWord]) -> List
             voters.append(voter)
 
         except Exception as e:
-            logger.debug(f"Failed to extract bbox for voter: {e}")
+            logger.debug("Failed to extract bbox for voter: %s", e)
             # Fall back to text-only data
             voters.append(
                 VoterInfo(
@@ -160,38 +182,51 @@ def extract_voter_blocks_with_boxes(text: str, ocr_words: List[OCRWord]) -> List
     return voters
 
 
-def _find_text_words(search_text: str, ocr_words: List[OCRWord]) -> List[OCRWord]:
+def _find_text_words(
+    search_text: str,
+    norm_words: List[Tuple[OCRWord, str]],
+    norm_texts: List[str],
+    by_norm: Dict[str, List[OCRWord]],
+) -> List[OCRWord]:
     """
     Find OCR words that match the search text.
 
-    Uses fuzzy matching to handle OCR variations.
+    Uses fuzzy matching to handle OCR variations. Both sides are
+    normalized exactly once: tokens before the word loop, words by the
+    caller for the whole page. Tokens the OCR read cleanly resolve via
+    the exact index; only misread tokens reach the scorer, and those go
+    through one extractOne call over the whole page instead of a Python
+    loop scoring word pairs one at a time.
 
     Args:
         search_text: Text to search for
-        ocr_words: List of OCR word objects
+        norm_words: (OCRWord, normalized text) pairs for the page
+        norm_texts: Just the normalized texts, aligned with norm_words
+        by_norm: Exact index from normalized word text to OCRWords
 
     Returns:
         List of matching OCRWord objects
     """
-    if not search_text or not ocr_words:
+    if not search_text or not norm_words:
         return []
 
     matching_words: List[OCRWord] = []
-    search_tokens = search_text.split()
-
-    for token in search_tokens:
-        # Find best matching OCR word
-        best_match = None
-        best_score = 0
-
-        for word in ocr_words:
-            score = fuzz.ratio(normalize_bn(token), normalize_bn(word["text"]))
-            if score > best_score and score >= 70:  # Threshold
-                best_score = score
-                best_match = word
+    norm_tokens = [normalize_bn(token) for token in search_text.split()]
+
+    for norm_token in norm_tokens:
+        # Exact hit: no fuzzy scan needed (score would be 100)
+        exact = by_norm.get(norm_token)
+        if exact:
+            if exact[0] not in matching_words:
+                matching_words.append(exact[0])
+            continue
 
-        if best_match and best_match not in matching_words:
-            matching_words.append(best_match)
+        # Best matching OCR word, scored in one C-level pass
+        best = process.extractOne(norm_token, norm_texts, scorer=fuzz.ratio, score_cutoff=70)
+        if best is not None:
+            best_match = norm_words[best[2]][0]
+            if best_match not in matching_words:
+                matching_words.append(best_match)
 
     return matching_words
 
@@ -209,10 +244,24 @@ def _get_combined_bbox(ocr_words: List[OCRWord]) -> BoundingBox:
     if not ocr_words:
         return BoundingBox(left=0, top=0, width=0, height=0)
 
-    min_left = min(word["bbox"]["left"] for word in ocr_words)
-    min_top = min(word["bbox"]["top"] for word in ocr_words)
-    max_right = max(word["bbox"]["left"] + word["bbox"]["width"] for word in ocr_words)
-    max_bottom = max(word["bbox"]["top"] + word["bbox"]["height"] for word in ocr_words)
+    # Single pass: four separate min()/max() generators would walk the
+    # word list four times and repeat every bbox field lookup
+    min_left = min_top = max_right = max_bottom = None
+    for word in ocr_words:
+        bbox = word.bbox
+        left, top = bbox.left, bbox.top
+        right, bottom = left + bbox.width, top + bbox.height
+        if min_left is None:
+            min_left, min_top, max_right, max_bottom = left, top, right, bottom
+        else:
+            if left < min_left:
+                min_left = left
+            if top < min_top:
+                min_top = top
+            if right > max_right:
+                max_right = right
+            if bottom > max_bottom:
+                max_bottom = bottom
 
     return BoundingBox(
         left=min_left, top=min_top, width=max_right - min_left, height=max_bottom - min_top
@@ -242,8 +291,98 @@ def fuzzy_match(a: str, b: str, threshold: int) -> bool:
         return False
 
     try:
-        score = fuzz.token_set_ratio(normalize_bn(a), normalize_bn(b))
+        a_norm = normalize_bn(a)
+        b_norm = normalize_bn(b)
+
+        # Identical normalized strings score 100; skip the scorer
+        if a_norm == b_norm and a_norm:
+            return True
+
+        # score_cutoff lets rapidfuzz's bit-parallel scorer abandon a
+        # pair as soon as the cutoff is unreachable; below-threshold
+        # pairs (the vast majority) return 0 without a full computation
+        score = fuzz.token_set_ratio(a_norm, b_norm, score_cutoff=threshold)
         return score >= threshold
     except Exception as e:
         logger.warning(f"Fuzzy match failed for '{a}' vs '{b}': {e}")
         return False
+
+
+@lru_cache(maxsize=8)
+def _query_bigram_union(normalized_queries: Tuple[str, ...]) -> Optional[frozenset]:
+    """
+    Union of character bigrams across all normalized queries.
+
+    Acts as a cheap admission filter in front of fuzzy scoring: a name
+    sharing no bigram with any query cannot plausibly reach a high
+    token_set_ratio, so the whole scoring pass can be skipped. Cached on
+    the query tuple, which is constant for a run.
+
+    Returns None when any query is shorter than two characters — such a
+    query contributes no bigrams, so the gate would reject names that
+    fuzzy_match accepts; callers must skip the gate in that case.
+    """
+    bigrams = set()
+    for query in normalized_queries:
+        if len(query) < 2:
+            return None
+        bigrams.update(query[i : i + 2] for i in range(len(query) - 1))
+    return frozenset(bigrams)
+
+
+# A pair sharing zero bigrams can still score up to exactly 80 on
+# token_set_ratio (e.g. "aa" vs "aba", an OCR-inserted character inside
+# a doubled letter), so the gate is only sound above that; at 81+ a
+# zero-overlap pair provably cannot reach the threshold
+_BIGRAM_GATE_MIN_THRESHOLD = 81
+
+
+def match_name_indices(name: str, normalized_queries: Sequence[str], threshold: int) -> List[int]:
+    """
+    Match one name against many pre-normalized queries in a single call.
+
+    Batches the whole query list through RapidFuzz's C-level scorer
+    dispatch instead of one Python-level fuzzy_match call per query.
+    Equivalent to ``[i for i, q in enumerate(queries) if fuzzy_match(name, q, threshold)]``
+    but with queries normalized once by the caller. The bigram prefilter
+    preserves that equivalence: it only engages at thresholds above 80,
+    where a pair sharing no bigram provably cannot score high enough.
+
+    Args:
+        name: Name to match (raw, will be normalized)
+        normalized_queries: Queries already passed through normalize_bn
+        threshold: Minimum similarity score (0-100) to consider a match
+
+    Returns:
+        Indices of all queries scoring >= threshold
+    """
+    if not name or not normalized_queries:
+        return []
+
+    norm_name = normalize_bn(name)
+
+    # Bigram prefilter: most OCR tokens resemble none of the queries, and
+    # one set-membership scan is far cheaper than a full scoring pass
+    if (
+        threshold >= _BIGRAM_GATE_MIN_THRESHOLD
+        and len(norm_name) > 1
+        and isinstance(normalized_queries, tuple)
+    ):
+        union = _query_bigram_union(normalized_queries)
+        if union is not None and not any(
+            norm_name[i : i + 2] in union for i in range(len(norm_name) - 1)
+        ):
+            return []
+
+    try:
+        matches = process.extract(
+            norm_name,
+            normalized_queries,
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=threshold,
+            limit=None,
+        )
+        return [index for _, _, index in matches]
+    except Exception as e:
+        logger.warning(f"Batch fuzzy match failed for '{name}': {e}")
+        return []
@@ -2,11 +2,18 @@
 Type definitions for electoral search.
 """
 
-from typing import NotRequired, Optional, TypedDict
+from typing import Dict, NamedTuple, NotRequired, Optional, TypedDict
 
 
-class BoundingBox(TypedDict):
-    """Bounding box coordinates for text."""
+class BoundingBox(NamedTuple):
+    """
+    Bounding box coordinates for text.
+
+    NamedTuple rather than TypedDict: pages yield thousands of these, and
+    tuple instances are ~3x smaller than dicts with faster attribute
+    access in the bbox aggregation loops. Use ``_asdict()`` when a box
+    crosses the JSON boundary (cache, export).
+    """
 
     left: int
     top: int
@@ -14,7 +21,7 @@ class BoundingBox(TypedDict):
     height: int
 
 
-class OCRWord(TypedDict):
+class OCRWord(NamedTuple):
     """OCR word-level data with bounding box and confidence."""
 
     text: str
@@ -33,11 +40,15 @@ class VoterInfo(TypedDict):
 
 
 class SearchResult(TypedDict):
-    """Search result with match information."""
+    """Search result with match information.
+
+    Serialized as-is to the cache and exports, so the bbox is stored in
+    its dict form (``BoundingBox._asdict()``) rather than as a tuple.
+    """
 
     file: str
     page: int
     name: str
     father: str
-    bbox: NotRequired[Optional[BoundingBox]]
+    bbox: NotRequired[Optional[Dict[str, int]]]
     confidence: NotRequired[Optional[float]]
@@ -4,16 +4,131 @@ Input validation and security functions.
 Provides path validation, file validation, and security checks.
 """
 
+import atexit
+import json
+import logging
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from .config import MAX_PDF_SIZE_MB
 
+# Optional: puremagic gives library-grade signature detection (it knows
+# about UTF-8 BOMs and other prefix quirks); the built-in prefix check
+# is the fallback and needs no dependency
+try:
+    import puremagic
+
+    _HAS_PUREMAGIC = True
+except ImportError:
+    _HAS_PUREMAGIC = False
+
+logger = logging.getLogger(__name__)
+
+# PDF file signature; reads are sized from it so adding signatures (or a
+# longer one) only means touching this constant
+_PDF_MAGIC = b"%PDF-"
+_PDF_MAGIC_LEN = len(_PDF_MAGIC)
+
+# Bytes read for signature detection: enough for puremagic to classify
+# confidently, still a single small read either way
+_PDF_HEADER_PROBE = 32
+
+# Size limit in bytes, computed once: the per-file check is an integer
+# compare, and megabytes only appear in the error message
+_MAX_PDF_SIZE_BYTES = MAX_PDF_SIZE_MB * 1024 * 1024
+
+# Memo of files whose magic-number check already passed, keyed by
+# (device, inode, mtime_ns, size) — the same change signal the result
+# cache uses. Bounded so it cannot grow without limit. It only persists
+# across runs once configure_validation_memo points it at the active
+# cache directory; unconfigured (tests, --no-cache) it stays in memory.
+_VALIDATION_MEMO_NAME = "validation.json"
+_VALIDATION_MEMO_MAX = 4096
+
+_validation_memo_file: Optional[Path] = None
+_validation_memo: Optional[Dict[str, bool]] = None
+_validation_memo_dirty = False
+
+
+def configure_validation_memo(cache_dir: Optional[Path]) -> None:
+    """
+    Point the validation memo at the run's cache directory.
+
+    Called once per run after cache setup so the memo honours
+    --cache-dir, and never called when caching is disabled, which keeps
+    --no-cache runs (and the test suite) from writing outside their
+    sandbox. Any entries loaded from a previously configured location
+    are dropped.
+
+    Args:
+        cache_dir: Cache directory to persist into, or None to keep the
+            memo in-memory only
+    """
+    global _validation_memo_file, _validation_memo, _validation_memo_dirty
+    _validation_memo_file = cache_dir / _VALIDATION_MEMO_NAME if cache_dir else None
+    _validation_memo = None
+    _validation_memo_dirty = False
+
+
+def _get_validation_memo() -> Dict[str, bool]:
+    """Load the validation memo on first use; corrupt files reset it."""
+    global _validation_memo
+    if _validation_memo is None:
+        _validation_memo = {}
+        if _validation_memo_file is not None:
+            try:
+                raw = json.loads(_validation_memo_file.read_bytes())
+                if len(raw) <= _VALIDATION_MEMO_MAX:
+                    _validation_memo = raw
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable validation memo: {e}")
+            atexit.register(_save_validation_memo)
+    return _validation_memo
+
+
+def _save_validation_memo() -> None:
+    """Persist the validation memo at exit if it gained entries."""
+    if not _validation_memo_dirty or _validation_memo is None or _validation_memo_file is None:
+        return
+    try:
+        _validation_memo_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _validation_memo_file.with_name(
+            f"{_validation_memo_file.name}.tmp.{os.getpid()}"
+        )
+        tmp_path.write_text(json.dumps(_validation_memo))
+        os.replace(tmp_path, _validation_memo_file)
+    except Exception as e:
+        logger.warning(f"Could not save validation memo: {e}")
+
+
+@lru_cache(maxsize=32)
+def _resolve_base(base_dir: str) -> str:
+    """
+    Resolve a base directory, memoized per distinct value.
+
+    Batch validation passes the same base_dir for every file, and each
+    resolution walks the whole path chasing symlinks; caching it makes
+    that one walk per run instead of one per file. Safe to cache because
+    base_dir comes from CLI/config input, not per-file data.
+    """
+    return os.path.realpath(base_dir)
+
 
 def validate_path_security(path: str, base_dir: Optional[str] = None) -> Path:
     """
     Validate file path to prevent directory traversal attacks.
 
+    Without a base_dir there is no containment to enforce, so an already
+    absolute path free of ".." components is returned as-is; resolution
+    (a stat per path component) only happens when it can change the
+    outcome of a check or normalize a relative or dotted path.
+
     Args:
         path: Path to validate
         base_dir: Optional base directory to restrict access to
@@ -25,42 +140,163 @@ def validate_path_security(path: str, base_dir: Optional[str] = None) -> Path:
         ValueError: If path is invalid or outside base_dir
     """
     try:
-        resolved_path = Path(path).resolve()
+        if base_dir is None:
+            p = Path(path)
+            if p.is_absolute() and ".." not in p.parts:
+                return p
 
-        # Check for path traversal
+        # realpath is the C-level core that Path.resolve wraps; calling
+        # it directly skips a PurePath allocation per component, and the
+        # Path object is only built once for the return value
+        resolved = os.path.realpath(path)
+
+        # Check for path traversal. commonpath compares whole path
+        # components, unlike the old string prefix check which accepted
+        # e.g. /data/pdfs-evil when the base was /data/pdfs
         if base_dir:
-            base_resolved = Path(base_dir).resolve()
-            if not str(resolved_path).startswith(str(base_resolved)):
+            base_resolved = _resolve_base(base_dir)
+            if os.path.commonpath([resolved, base_resolved]) != base_resolved:
                 raise ValueError(f"Path '{path}' is outside allowed directory '{base_dir}'")
 
-        return resolved_path
-    except Exception as e:
-        raise ValueError(f"Invalid path '{path}': {e}")
+        return Path(resolved)
+    except ValueError:
+        # Our own containment error; re-wrapping it would only bury the
+        # message under a generic prefix
+        raise
+    except OSError as e:
+        raise ValueError(f"Invalid path '{path}': {e}") from e
+
 
+def _is_pdf_header(header: bytes) -> bool:
+    """
+    Decide whether a header buffer identifies a PDF.
 
-def validate_pdf_file(pdf_path: Path) -> None:
+    Prefers puremagic when installed, which classifies from the bytes in
+    hand without touching the filesystem again; otherwise falls back to
+    the plain %PDF- prefix check.
+    """
+    if _HAS_PUREMAGIC:
+        try:
+            return puremagic.from_string(header, mime=True) == "application/pdf"
+        except puremagic.PureError:
+            return False
+    return header[:_PDF_MAGIC_LEN] == _PDF_MAGIC
+
+
+def _check_type_and_size(st: os.stat_result, pdf_path: Path) -> None:
+    """Reject non-regular files and files over the size limit."""
+    if not stat.S_ISREG(st.st_mode):
+        raise ValueError(f"Path is not a file: {pdf_path}")
+
+    if st.st_size > _MAX_PDF_SIZE_BYTES:
+        size_mb = st.st_size / (1024 * 1024)
+        raise ValueError(f"PDF file too large: {size_mb:.1f}MB (max: {MAX_PDF_SIZE_MB}MB)")
+
+
+def validate_pdf_file(pdf_path: Path, strict: bool = False) -> None:
     """
     Validate PDF file meets security and resource requirements.
 
     Args:
         pdf_path: Path to PDF file
+        strict: Also require a %%EOF marker in the last KiB of the file.
+            Header-only detection accepts truncated downloads; the
+            trailer scan catches those at the cost of one extra read, so
+            it is opt-in to keep the default path at a single syscall.
 
     Raises:
         ValueError: If file is invalid or exceeds limits
     """
-    if not pdf_path.exists():
-        raise ValueError(f"PDF file not found: {pdf_path}")
+    global _validation_memo_dirty
 
-    if not pdf_path.is_file():
-        raise ValueError(f"Path is not a file: {pdf_path}")
+    # Memo fast path: a file whose header check already passed, with
+    # unchanged identity and timestamp, only costs one stat. Size and
+    # type are re-verified here since the limit can change between runs.
+    # The strict trailer check is never memoized.
+    if not strict:
+        try:
+            st = os.stat(pdf_path)
+        except FileNotFoundError:
+            raise ValueError(f"PDF file not found: {pdf_path}") from None
 
-    # Check file size
-    size_mb = pdf_path.stat().st_size / (1024 * 1024)
-    if size_mb > MAX_PDF_SIZE_MB:
-        raise ValueError(f"PDF file too large: {size_mb:.1f}MB (max: {MAX_PDF_SIZE_MB}MB)")
+        _check_type_and_size(st, pdf_path)
+
+        memo = _get_validation_memo()
+        memo_key = f"{st.st_dev}:{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+        if memo.get(memo_key):
+            return
+
+    # Open first, then fstat the descriptor: one path walk answers
+    # existence, file type and size, and because the size and header
+    # checks run against the same open fd there is no window for the
+    # file to be swapped between them. A raw fd rather than open():
+    # BufferedReader would allocate an 8 KiB buffer to read 5 bytes.
+    try:
+        fd = os.open(pdf_path, os.O_RDONLY)
+    except FileNotFoundError:
+        raise ValueError(f"PDF file not found: {pdf_path}") from None
+    except IsADirectoryError:
+        raise ValueError(f"Path is not a file: {pdf_path}") from None
+
+    try:
+        st = os.fstat(fd)
+        _check_type_and_size(st, pdf_path)
 
-    # Basic file type check (magic number)
-    with open(pdf_path, "rb") as f:
-        header = f.read(5)
-        if header != b"%PDF-":
+        # File type check: one read covers both detectors
+        header = os.read(fd, _PDF_HEADER_PROBE)
+        if not _is_pdf_header(header):
             raise ValueError(f"File is not a valid PDF: {pdf_path}")
+
+        # Optional trailer check: a valid PDF ends with %%EOF, usually
+        # within the last line; truncated files lack it
+        if strict:
+            tail = os.pread(fd, 1024, max(0, st.st_size - 1024))
+            if b"%%EOF" not in tail:
+                raise ValueError(f"PDF file is truncated (missing %%EOF): {pdf_path}")
+        else:
+            # Record under the fstat identity — the file actually read —
+            # not the earlier path stat
+            memo = _get_validation_memo()
+            if len(memo) >= _VALIDATION_MEMO_MAX:
+                memo.clear()
+            memo[f"{st.st_dev}:{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"] = True
+            _validation_memo_dirty = True
+    finally:
+        os.close(fd)
+
+
+def _validate_one(pdf_path: Path, strict: bool) -> Tuple[Path, Optional[str]]:
+    """Validate one PDF, returning its error message instead of raising."""
+    try:
+        validate_pdf_file(pdf_path, strict=strict)
+        return pdf_path, None
+    except ValueError as e:
+        return pdf_path, str(e)
+
+
+def validate_pdf_files(
+    pdf_paths: List[Path], strict: bool = False, max_workers: int = 8
+) -> List[Tuple[Path, Optional[str]]]:
+    """
+    Validate many PDFs concurrently.
+
+    Each validation is a couple of syscalls whose wall time is disk (or
+    NFS) latency, during which the GIL is released, so a thread pool
+    overlaps them cleanly. Failures are collected per file rather than
+    raised, matching the batch-processing rule that one bad PDF must not
+    stop the rest.
+
+    Args:
+        pdf_paths: PDF paths to validate
+        strict: Forwarded to validate_pdf_file
+        max_workers: Thread pool size cap
+
+    Returns:
+        List of (path, error message or None) in input order
+    """
+    if not pdf_paths:
+        return []
+
+    workers = min(max_workers, len(pdf_paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda p: _validate_one(p, strict), pdf_paths))
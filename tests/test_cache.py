@@ -1,53 +1,43 @@
 """Tests for caching module."""
 
-import tempfile
-from pathlib import Path
 import pytest
 
 from electoral_search.cache import ResultCache
 
 
+@pytest.fixture
+def cache_and_pdf(tmp_path):
+    """A fresh ResultCache and a minimal PDF file to key it with."""
+    pdf_file = tmp_path / "test.pdf"
+    pdf_file.write_bytes(b"%PDF-test")
+    return ResultCache(cache_dir=tmp_path / "cache"), pdf_file
+
+
 class TestResultCache:
     """Tests for result caching."""
 
-    def test_cache_initialization(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = ResultCache(cache_dir=Path(tmpdir))
-            assert cache.cache_dir.exists()
+    def test_cache_initialization(self, cache_and_pdf):
+        cache, _ = cache_and_pdf
+        assert cache.cache_dir.exists()
 
-    def test_cache_miss(self, tmp_path):
+    def test_cache_miss(self, cache_and_pdf):
         """Test cache miss."""
-        cache_dir = tmp_path / "cache"
-        cache = ResultCache(cache_dir=cache_dir)
-
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-test")
-
+        cache, pdf_file = cache_and_pdf
         result = cache.get(pdf_file, ["test"], 80)
         assert result is None
 
-    def test_cache_set_and_get(self, tmp_path):
+    def test_cache_set_and_get(self, cache_and_pdf):
         """Test setting and getting cache."""
-        cache_dir = tmp_path / "cache"
-        cache = ResultCache(cache_dir=cache_dir)
-
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-test")
-
+        cache, pdf_file = cache_and_pdf
         results = [{"name": "test", "page": 1}]
         cache.set(pdf_file, ["test"], 80, results)
 
         cached = cache.get(pdf_file, ["test"], 80)
         assert cached == results
 
-    def test_cache_different_params(self, tmp_path):
+    def test_cache_different_params(self, cache_and_pdf):
         """Test cache with different parameters."""
-        cache_dir = tmp_path / "cache"
-        cache = ResultCache(cache_dir=cache_dir)
-
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-test")
-
+        cache, pdf_file = cache_and_pdf
         results = [{"name": "test", "page": 1}]
         cache.set(pdf_file, ["test"], 80, results)
 
@@ -55,14 +45,9 @@ class TestResultCache:
         cached = cache.get(pdf_file, ["test"], 90)
         assert cached is None
 
-    def test_clear_cache(self, tmp_path):
+    def test_clear_cache(self, cache_and_pdf):
         """Test clearing cache."""
-        cache_dir = tmp_path / "cache"
-        cache = ResultCache(cache_dir=cache_dir)
-
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-test")
-
+        cache, pdf_file = cache_and_pdf
         results = [{"name": "test", "page": 1}]
         cache.set(pdf_file, ["test"], 80, results)
 
@@ -72,12 +57,49 @@ class TestResultCache:
         cached = cache.get(pdf_file, ["test"], 80)
         assert cached is None
 
-    def test_cache_stats(self, tmp_path):
+    def test_cache_stats(self, cache_and_pdf):
         """Test cache statistics."""
-        cache_dir = tmp_path / "cache"
-        cache = ResultCache(cache_dir=cache_dir)
-
+        cache, _ = cache_and_pdf
         stats = cache.get_stats()
         assert "total_entries" in stats
         assert "total_size_mb" in stats
         assert "cache_dir" in stats
+
+
+class TestVoterCache:
+    """Tests for the voter-level cache layer."""
+
+    # Shaped like the VoterInfo dicts extract_voter_pages produces
+    PAGES = [(1, [{"name": "রহিম", "father": "করিম"}])]
+
+    def test_voters_round_trip(self, cache_and_pdf):
+        cache, pdf_file = cache_and_pdf
+        cache.set_voters(pdf_file, self.PAGES)
+        assert cache.get_voters(pdf_file) == self.PAGES
+
+    def test_voters_ttl_expiry(self, tmp_path):
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(b"%PDF-test")
+        cache = ResultCache(cache_dir=tmp_path / "cache", ttl_days=0)
+
+        cache.set_voters(pdf_file, self.PAGES)
+        assert cache.get_voters(pdf_file) is None
+
+    def test_voters_version_mismatch(self, cache_and_pdf, monkeypatch):
+        import electoral_search.cache as cache_module
+
+        cache, pdf_file = cache_and_pdf
+        cache.set_voters(pdf_file, self.PAGES)
+
+        monkeypatch.setattr(cache_module, "CACHE_VERSION", "0.0")
+        assert cache.get_voters(pdf_file) is None
+
+    def test_changed_names_reuse_voters(self, cache_and_pdf):
+        """A new name list misses the result cache but still hits the
+        voter cache, which is what lets process_pdf skip OCR."""
+        cache, pdf_file = cache_and_pdf
+        cache.set(pdf_file, ["রহিম"], 80, [{"name": "রহিম", "page": 1}])
+        cache.set_voters(pdf_file, self.PAGES)
+
+        assert cache.get(pdf_file, ["করিম"], 80) is None
+        assert cache.get_voters(pdf_file) == self.PAGES
@@ -2,7 +2,7 @@
 
 import multiprocessing as mp
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import pytest
 
 from electoral_search.parallel import get_optimal_workers, process_pdfs_parallel
@@ -36,6 +36,7 @@ class TestGetOptimalWorkers:
         assert workers == 1
 
 
+@pytest.mark.slow
 class TestProcessPdfsParallel:
     """Tests for parallel PDF processing."""
 
@@ -43,6 +44,13 @@ class TestProcessPdfsParallel:
         results = process_pdfs_parallel([], lambda x: [])
         assert results == []
 
+    def test_empty_list_spawns_no_pool(self):
+        """Empty input must return before any worker pool is created."""
+        with patch("electoral_search.parallel.get_mp_context") as mock_ctx:
+            results = process_pdfs_parallel([], lambda x: [])
+        assert results == []
+        mock_ctx.assert_not_called()
+
     def test_single_file(self, tmp_path):
         """Test processing a single file."""
         pdf_file = tmp_path / "test.pdf"
@@ -1,7 +1,12 @@
 """Tests for text processing module."""
 
 import pytest
-from electoral_search.text_processing import normalize_bn, extract_voter_blocks, fuzzy_match
+from electoral_search.text_processing import (
+    normalize_bn,
+    extract_voter_blocks,
+    fuzzy_match,
+    match_name_indices,
+)
 
 
 class TestNormalizeBn:
@@ -65,3 +70,15 @@ class TestFuzzyMatch:
 
     def test_empty_strings(self):
         assert fuzzy_match("", "", 80) is False
+
+    def test_single_char_query_matches_like_fuzzy_match(self):
+        # A 1-char query has no bigrams; the prefilter must stand aside
+        # so batch matching agrees with fuzzy_match
+        assert fuzzy_match("কখ", "ক", 60) is True
+        assert match_name_indices("কখ", ("ক",), 60) == [0]
+
+    def test_zero_bigram_overlap_matches_below_gate_floor(self):
+        # "aa" and "aba" share no bigram yet score exactly 80, so the
+        # gate must not engage at thresholds it cannot reason about
+        assert fuzzy_match("aba", "aa", 75) is True
+        assert match_name_indices("aba", ("aa",), 75) == [0]
@@ -3,7 +3,11 @@
 import tempfile
 from pathlib import Path
 import pytest
-from electoral_search.validation import validate_path_security, validate_pdf_file
+from electoral_search.validation import (
+    validate_path_security,
+    validate_pdf_file,
+    validate_pdf_files,
+)
 
 
 class TestValidatePathSecurity:
@@ -28,30 +32,45 @@ class TestValidatePdfFile:
         with pytest.raises(ValueError, match="not found"):
             validate_pdf_file(Path("/nonexistent/file.pdf"))
 
-    def test_directory_not_file(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(ValueError, match="not a file"):
-                validate_pdf_file(Path(tmpdir))
+    def test_directory_not_file(self, tmp_path):
+        with pytest.raises(ValueError, match="not a file"):
+            validate_pdf_file(tmp_path)
 
-    def test_invalid_pdf_magic_number(self):
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"NOT A PDF")
-            f.flush()
-            temp_path = Path(f.name)
+    def test_invalid_pdf_magic_number(self, tmp_path):
+        bad = tmp_path / "bad.pdf"
+        bad.write_bytes(b"NOT A PDF")
 
-        try:
-            with pytest.raises(ValueError, match="not a valid PDF"):
-                validate_pdf_file(temp_path)
-        finally:
-            temp_path.unlink()
+        with pytest.raises(ValueError, match="not a valid PDF"):
+            validate_pdf_file(bad)
+
+    def test_batch_validation_collects_errors(self, tmp_path):
+        good = tmp_path / "good.pdf"
+        good.write_bytes(b"%PDF-1.4\ntest")
+        bad = tmp_path / "bad.pdf"
+        bad.write_bytes(b"NOT A PDF")
+
+        outcomes = validate_pdf_files([good, bad])
+        assert outcomes[0] == (good, None)
+        assert outcomes[1][0] == bad
+        assert "not a valid PDF" in outcomes[1][1]
+
+    def test_valid_pdf_header(self, tmp_path):
+        good = tmp_path / "good.pdf"
+        good.write_bytes(b"%PDF-1.4\ntest")
+
+        validate_pdf_file(good)  # Should not raise
+
+    def test_validation_memo_persists_only_when_configured(self, tmp_path):
+        from electoral_search import validation
 
-    def test_valid_pdf_header(self):
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"%PDF-1.4\ntest")
-            f.flush()
-            temp_path = Path(f.name)
+        good = tmp_path / "good.pdf"
+        good.write_bytes(b"%PDF-1.4\ntest")
 
+        validation.configure_validation_memo(tmp_path / "cache")
         try:
-            validate_pdf_file(temp_path)  # Should not raise
+            validate_pdf_file(good)
+            validation._save_validation_memo()
+            assert (tmp_path / "cache" / "validation.json").exists()
         finally:
-            temp_path.unlink()
+            # Back to in-memory only so no other test writes to disk
+            validation.configure_validation_memo(None)